@@ -1,3 +1,7 @@
 # -*- coding: utf-8 -*-
+from cgnlib._version import __version__
 from cgnlib.cgnlib import cgnlib
-from cgnlib.cgnexp import cgnexp
\ No newline at end of file
+from cgnlib.cgnexp import cgnexp
+from cgnlib.stopping import FirstDrop, Patience, TargetCommunities, TimeBudget, Never, AnyOf
+from cgnlib.trace import IterationEvent, TraceRecorder
+from cgnlib.removal import MaxTies, NearTies, TopK, TopFraction, OnePerComponent
@@ -0,0 +1,324 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+
+import networkx as nx
+import numpy as np
+
+from cgnlib.cgnlib import cgnlib
+from cgnlib.measure import Measurement
+
+GENERATORS = ('lfr', 'sbm', 'powerlaw')
+
+# Every metric _calculate_centrality_for_edges dispatches itself
+CENTRALITY_METRICS = ('closeness', 'betweenness', 'pagerank', 'degree', 'l1', 'tworw', 'gec', 'gec_approx',
+                      'isolating')
+
+DEFAULT_SIZES = (100, 200, 400, 800)
+
+# Removal rounds timed per detect_gn run, so runs of every size do comparable work per round
+DETECT_GN_ROUNDS = 10
+
+# A case is not run on larger graphs once one run takes longer than this
+MAX_SECONDS = 30.0
+
+# Relative slowdown or memory growth at any size above which a case regresses
+REGRESSION_THRESHOLD = 0.25
+
+# Increase of a scaling exponent above which a case regresses
+EXPONENT_THRESHOLD = 0.25
+
+# Fewest timed runs per case that a baseline comparison accepts; a single run is too noisy
+MIN_BASELINE_REPEAT = 3
+
+# Runs shorter than this, or peaks smaller than this, are too noisy to compare
+MIN_TIME = 0.01
+MIN_MEMORY_MB = 1.0
+
+AVERAGE_DEGREE = 6
+
+
+def _lfr_graph(n, seed):
+    G = nx.LFR_benchmark_graph(n, 3, 1.5, 0.1, average_degree=AVERAGE_DEGREE, max_degree=max(15, n // 20),
+                               min_community=max(10, n // 40), max_community=max(30, n // 8), seed=seed)
+    communities = list({frozenset(G.nodes[node]['community']) for node in G})
+    return G, communities
+
+
+def _sbm_graph(n, seed):
+    # Blocks of about 50 nodes with a tenth of every node's expected degree leaving its block
+    k = max(2, n // 50)
+    sizes = [n // k + (i < n % k) for i in range(k)]
+    p_in = 0.9 * AVERAGE_DEGREE / (n / k - 1)
+    p_out = 0.1 * AVERAGE_DEGREE / (n - n / k)
+    probabilities = [[p_in if i == j else p_out for j in range(k)] for i in range(k)]
+    G = nx.stochastic_block_model(sizes, probabilities, seed=seed)
+    return G, [set(block) for block in G.graph['partition']]
+
+
+def _powerlaw_graph(n, seed):
+    # Holme-Kim graph: power-law degrees with some clustering, but no planted communities
+    G = nx.powerlaw_cluster_graph(n, AVERAGE_DEGREE // 2, 0.1, seed=seed)
+    return G, list(nx.community.label_propagation_communities(G))
+
+
+def generate_graph(generator, n, seed=0):
+    """
+    Builds a seeded synthetic graph.
+
+    Args:
+        generator (str): 'lfr' (LFR benchmark), 'sbm' (stochastic block model)
+            or 'powerlaw' (Holme-Kim power-law cluster graph).
+        n (int): Number of nodes.
+
+    Returns:
+        tuple: (graph, communities), the planted communities for 'lfr' and
+        'sbm' and label propagation communities for 'powerlaw'.
+    """
+    if generator == 'lfr':
+        G, communities = _lfr_graph(n, seed)
+    elif generator == 'sbm':
+        G, communities = _sbm_graph(n, seed)
+    elif generator == 'powerlaw':
+        G, communities = _powerlaw_graph(n, seed)
+    else:
+        raise ValueError(f"Unsupported generator: {generator}. Choose one of {GENERATORS}.")
+    G.remove_edges_from(list(nx.selfloop_edges(G)))
+    return G, communities
+
+
+def _write_edge_list(G, path):
+    with open(path, 'w') as file:
+        for u, v in G.edges():
+            file.write(f"{u} {v}\n")
+
+
+class _Rounds:
+    """
+    Stopping policy ending detect_gn after a fixed number of removal rounds.
+    """
+
+    def __init__(self, n):
+        self.n = n
+
+    def __call__(self, state):
+        return state.iteration >= self.n
+
+
+def benchmark_cases(centrality_metrics=CENTRALITY_METRICS, gn_metrics=('closeness',)):
+    """
+    Returns the benchmark cases as (name, setup) pairs.
+
+    ``setup(file, communities)`` prepares one run and returns the callable
+    that is measured, so loading and other preparation are never timed.
+    """
+    def load(file, communities):
+        return lambda: cgnlib(file, cache=False)
+
+    def centrality(metric):
+        def setup(file, communities):
+            graph_data = cgnlib(file, cache=False)
+            return lambda: graph_data._calculate_centrality_for_edges(graph_data.core, metric)
+        return setup
+
+    def detect_gn(metric):
+        def setup(file, communities):
+            graph_data = cgnlib(file, cache=False)
+            return lambda: graph_data.detect_gn(metric, stop=_Rounds(DETECT_GN_ROUNDS))
+        return setup
+
+    def quality(file, communities):
+        graph_data = cgnlib(file, cache=False)
+        graph_data.best_communities = [
+            {str(node) for node in community if str(node) in graph_data.core} for community in communities
+        ]
+        return graph_data.evaluate_community_quality
+
+    cases = [('load', load)]
+    cases += [(f'centrality:{metric}', centrality(metric)) for metric in centrality_metrics]
+    cases += [(f'detect_gn:{metric}', detect_gn(metric)) for metric in gn_metrics]
+    cases.append(('quality', quality))
+    return cases
+
+
+def scaling_exponent(sizes, values):
+    """
+    Fits values ~ c * size^k by least squares in log-log space and returns k,
+    or None with fewer than two positive points.
+    """
+    points = [(s, v) for s, v in zip(sizes, values) if v is not None and v > 0]
+    if len(points) < 2:
+        return None
+    x, y = np.log([s for s, _ in points]), np.log([v for _, v in points])
+    return float(np.polyfit(x, y, 1)[0])
+
+
+def run_benchmarks(generators=GENERATORS, sizes=DEFAULT_SIZES, cases=None, repeat=3, seed=0,
+                   max_seconds=MAX_SECONDS):
+    """
+    Runs every case on every generator across the size ladder.
+
+    Time is the fastest of ``repeat`` runs; memory is the tracemalloc peak of
+    one extra run, in MB, or None when a timed run exceeded ``max_seconds``
+    and tracing it too would only slow it down further. A case stops
+    climbing the ladder of a generator once a run exceeds ``max_seconds``.
+
+    Returns:
+        dict: The run settings and, per '<generator>/<case>', the measured
+        'nodes', 'edges', 'time' and 'memory' lists and their
+        'time_exponent' and 'memory_exponent'.
+    """
+    if cases is None:
+        cases = benchmark_cases()
+    results = {
+        'sizes': list(sizes),
+        'seed': seed,
+        'repeat': repeat,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cases': {},
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        for generator in generators:
+            too_slow = set()
+            for n in sizes:
+                G, communities = generate_graph(generator, n, seed)
+                file = os.path.join(directory, f'{generator}-{n}.txt')
+                _write_edge_list(G, file)
+                for name, setup in cases:
+                    if name in too_slow:
+                        continue
+                    print(f"Running {generator}/{name} on {n} nodes...")
+                    times = []
+                    for _ in range(repeat):
+                        run = setup(file, communities)
+                        with Measurement() as measurement:
+                            run()
+                        times.append(measurement.wall_time)
+                        if measurement.wall_time > max_seconds:
+                            break
+                    memory = None
+                    if max(times) <= max_seconds:
+                        run = setup(file, communities)
+                        with Measurement(trace_memory=True) as measurement:
+                            run()
+                        memory = measurement.peak_traced
+
+                    entry = results['cases'].setdefault(f'{generator}/{name}',
+                                                        {'nodes': [], 'edges': [], 'time': [], 'memory': []})
+                    entry['nodes'].append(n)
+                    entry['edges'].append(G.number_of_edges())
+                    entry['time'].append(min(times))
+                    entry['memory'].append(memory)
+                    if min(times) > max_seconds:
+                        too_slow.add(name)
+
+    for entry in results['cases'].values():
+        entry['time_exponent'] = scaling_exponent(entry['nodes'], entry['time'])
+        entry['memory_exponent'] = scaling_exponent(entry['nodes'], entry['memory'])
+    return results
+
+
+def compare_to_baseline(results, baseline, threshold=REGRESSION_THRESHOLD, exponent_threshold=EXPONENT_THRESHOLD):
+    """
+    Compares benchmark results with a baseline from ``run_benchmarks``.
+
+    A case regresses when its time or memory at a size both runs measured
+    grows by more than ``threshold`` (relative), or when a scaling exponent
+    fitted on the same sizes grows by more than ``exponent_threshold``. Cases
+    or sizes missing from either side are ignored, as are measurements below
+    ``MIN_TIME`` and ``MIN_MEMORY_MB``.
+
+    Returns:
+        list of str: One message per regression.
+    """
+    regressions = []
+    for name, entry in results['cases'].items():
+        reference = baseline.get('cases', {}).get(name)
+        if reference is None:
+            continue
+        for quantity, floor, unit in (('time', MIN_TIME, 's'), ('memory', MIN_MEMORY_MB, 'MB')):
+            measured = dict(zip(entry['nodes'], entry[quantity]))
+            for n, before in zip(reference['nodes'], reference[quantity]):
+                after = measured.get(n)
+                if before is None or after is None or max(before, after) < floor:
+                    continue
+                if after > before * (1 + threshold):
+                    regressions.append(f"{name}: {quantity} on {n} nodes went from {before:.3f} {unit} "
+                                       f"to {after:.3f} {unit} ({after / before - 1:+.0%})")
+
+            # Exponents are only comparable when fitted on the same ladder, above the noise floor
+            values = reference[quantity] + entry[quantity]
+            if reference['nodes'] != entry['nodes'] or None in values or min(values) < floor:
+                continue
+            before, after = reference.get(f'{quantity}_exponent'), entry.get(f'{quantity}_exponent')
+            if before is not None and after is not None and after - before > exponent_threshold:
+                regressions.append(f"{name}: {quantity} scaling exponent went from {before:.2f} to {after:.2f}")
+    return regressions
+
+
+def print_results(results):
+    """
+    Prints the time and memory of every case per size, with their scaling exponents.
+    """
+    def exponent(value):
+        return '-' if value is None else f'{value:.2f}'
+
+    def megabytes(value):
+        return '-' if value is None else f'{value:.2f}'
+
+    for name, entry in results['cases'].items():
+        print(f"{name}  (time ~ n^{exponent(entry['time_exponent'])}, "
+              f"memory ~ n^{exponent(entry['memory_exponent'])})")
+        for n, m, seconds, memory in zip(entry['nodes'], entry['edges'], entry['time'], entry['memory']):
+            print(f"    {n:>8} nodes {m:>9} edges  {seconds:10.4f} s  {megabytes(memory):>10} MB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmarks cgnlib on seeded synthetic graphs and checks for regressions against a baseline.")
+    parser.add_argument('--generators', nargs='+', choices=GENERATORS, default=list(GENERATORS))
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(DEFAULT_SIZES), help="Node counts of the ladder.")
+    parser.add_argument('--metrics', nargs='+', default=list(CENTRALITY_METRICS),
+                        help="Centralities benchmarked on their own.")
+    parser.add_argument('--gn-metrics', nargs='+', default=['closeness'], help="Centralities benchmarked in detect_gn.")
+    parser.add_argument('--repeat', type=int, default=MIN_BASELINE_REPEAT,
+                        help="Timed runs per case; the fastest counts.")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-seconds', type=float, default=MAX_SECONDS,
+                        help="Stop growing a case once one run exceeds this.")
+    parser.add_argument('--output', help="Write the results to this JSON file.")
+    parser.add_argument('--baseline', help="Compare against this JSON file and exit with status 1 on regressions.")
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help="Relative time or memory growth that counts as a regression.")
+    parser.add_argument('--exponent-threshold', type=float, default=EXPONENT_THRESHOLD,
+                        help="Scaling exponent growth that counts as a regression.")
+    args = parser.parse_args(argv)
+    if args.baseline and args.repeat < MIN_BASELINE_REPEAT:
+        parser.error(f"--baseline needs --repeat of at least {MIN_BASELINE_REPEAT}; fewer runs give false regressions")
+
+    results = run_benchmarks(args.generators, args.sizes, benchmark_cases(args.metrics, args.gn_metrics),
+                             args.repeat, args.seed, args.max_seconds)
+    print_results(results)
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+        print(f"Results exported to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        regressions = compare_to_baseline(results, baseline, args.threshold, args.exponent_threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            return 1
+        print(f"No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,8 +1,190 @@
 import csv
 import os
 from cgnlib import cgnlib
+from cgnlib.cgnlib import FUSED_METRICS, GIRVAN_NEWMAN_METHODS
 import time
-import tracemalloc
+import functools
+import multiprocessing
+from multiprocessing.connection import wait
+from cgnlib.graphcache import file_digest
+from cgnlib.resultstore import ResultStore
+from cgnlib.measure import Measurement, PhaseTimer
+from cgnlib.memo import CentralityCache
+
+# Result columns filled from the per-phase timings of a run
+PHASE_COLUMNS = {
+    'line_graph': 'Line Graph Time (s)',
+    'centrality': 'Centrality Time (s)',
+    'modularity': 'Components & Modularity Time (s)',
+    'evaluation': 'Evaluation Time (s)',
+}
+
+RESULT_FIELDS = ['Dataset', 'Centrality Metric', 'Modularity', 'Average Conductance',
+                 'Min Conductance', 'Max Conductance', 'Coverage', 'Number of Communities',
+                 'Wall Time (s)', 'CPU Time (s)', 'Shared Time (s)', 'Peak RSS (MB)',
+                 'Process Peak RSS (MB)', 'Peak Traced Memory (MB)',
+                 *PHASE_COLUMNS.values()]
+
+
+def _dataset_name(file):
+    return os.path.splitext(os.path.basename(file))[0]
+
+
+def _run_experiment(graph_data, dataset_name, metric, save_images=False, save_folder='images/', measurement=Measurement,
+                    shared_time=0.0):
+    """
+    Runs community detection for one (dataset, metric) pair and returns its result row.
+
+    Args:
+        measurement (callable): Factory for the measurement context manager whose
+            ``columns()`` are added to the row; see ``cgnlib.measure.Measurement``.
+        shared_time (float): This run's share of the wall time spent computing
+            first iterations together before it, see ``_load_graph``.
+    """
+    print(f"Running experiment on {dataset_name} with {metric} centrality...")
+
+    evaluation = PhaseTimer()
+    with measurement() as measured:
+        communities = graph_data.detect_gn(method=metric)
+        with evaluation.phase('evaluation'):
+            quality_metrics = graph_data.evaluate_community_quality()
+
+    columns = measured.columns()
+    if columns.get('Peak RSS (MB)') is not None:
+        peak = f"peak RSS = {columns['Peak RSS (MB)']} MB"
+    else:
+        peak = f"process peak RSS = {columns.get('Process Peak RSS (MB)')} MB"
+    print(f"      ✅ Done in {columns['Wall Time (s)']} sec (CPU {columns['CPU Time (s)']} sec), {peak}")
+
+
+    modularity = quality_metrics.get("Modularity")
+    average_conductance = quality_metrics.get("Average Conductance")
+    min_conductance = quality_metrics.get("Min Conductance")
+    max_conductance = quality_metrics.get("Max Conductance")
+    coverage = quality_metrics.get("Coverage")
+    num_communities = len(communities)
+
+    result = {
+        'Dataset': dataset_name,
+        'Centrality Metric': metric,
+        'Modularity': modularity,
+        'Average Conductance': average_conductance,
+        'Min Conductance': min_conductance,
+        'Max Conductance': max_conductance,
+        'Coverage': coverage,
+        'Number of Communities': num_communities
+    }
+    result.update(columns)
+    result['Shared Time (s)'] = round(shared_time, 3)
+    phases = dict(graph_data.timings.totals, **evaluation.totals)
+    for phase, column in PHASE_COLUMNS.items():
+        result[column] = round(phases[phase], 3) if phase in phases else None  # None: the method has no such phase
+
+    if save_images:
+        image_filename = os.path.join(save_folder, f"{dataset_name}_{metric}.png")
+        graph_data.visualize_best_communities(image_filename)
+        print(f"Image saved as {image_filename}")
+
+    return result
+
+
+def _shared_metrics(metrics):
+    """
+    Returns the metrics whose first iterations are worth computing together:
+    the shortest-path metrics that share one traversal, if there are several.
+    """
+    shared = [metric for metric in metrics if metric in FUSED_METRICS]
+    return shared if len(shared) > 1 else []
+
+
+def _prime(graph_data, metrics, shared_time):
+    """
+    Computes the first-iteration edge centralities of ``metrics`` together,
+    for ``detect_gn`` to reuse, and records each metric's equal share of the
+    wall time in ``shared_time``. Metrics already primed are skipped, and so
+    are metrics ``compute_edge_centralities`` rejects; their runs report the error.
+    """
+    metrics = [metric for metric in metrics if metric not in shared_time and metric not in GIRVAN_NEWMAN_METHODS]
+    if graph_data.core is None or not metrics:
+        return
+    start = time.perf_counter()
+    try:
+        graph_data.compute_edge_centralities(metrics=metrics)
+    except ValueError:
+        return
+    shared_time.update(dict.fromkeys(metrics, (time.perf_counter() - start) / len(metrics)))
+
+
+def _load_graph(file, shared_metrics, centrality_cache=None):
+    """
+    Loads a dataset and computes the first iterations of ``shared_metrics``
+    together; see ``_shared_metrics``.
+
+    Returns:
+        tuple: The cgnlib instance and a dict of primed metric to its share of
+        the wall time spent on first iterations, which ``_prime`` extends.
+    """
+    graph_data = cgnlib(file, centrality_cache=centrality_cache)
+    shared_time = {}
+    _prime(graph_data, shared_metrics, shared_time)
+    return graph_data, shared_time
+
+
+def _experiment_worker(connection, centrality_cache=None):
+    """
+    Worker process loop: receives (index, file, metric, shared_metrics, options)
+    tasks, where options are keyword arguments for ``_run_experiment``, and sends
+    back (index, status, payload). Each graph is loaded once per worker, with the
+    first iteration of ``shared_metrics`` computed together, and reused for every
+    later task on the same file.
+    """
+    graphs = {}
+    while True:
+        task = connection.recv()
+        if task is None:
+            break
+        index, file, metric, shared_metrics, options = task
+        try:
+            if file not in graphs:
+                graphs[file] = _load_graph(file, shared_metrics, centrality_cache)
+            graph_data, shared_time = graphs[file]
+            _prime(graph_data, [metric], shared_time)
+            result = _run_experiment(graph_data, _dataset_name(file), metric, shared_time=shared_time.get(metric, 0.0),
+                                     **options)
+            connection.send((index, 'ok', result))
+        except Exception as e:
+            connection.send((index, 'error', f"{type(e).__name__}: {e}"))
+
+
+class _ExperimentWorker:
+    def __init__(self, context, centrality_cache=None):
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(target=_experiment_worker, args=(child_connection, centrality_cache),
+                                       daemon=True)
+        self.process.start()
+        child_connection.close()
+        self.task = None
+        self.started = None
+
+    def submit(self, task):
+        self.task = task
+        self.started = time.monotonic()
+        self.connection.send(task)
+
+    def stop(self):
+        try:
+            self.connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+
+    def kill(self):
+        self.process.terminate()
+        self.process.join()
+        self.connection.close()
 
 
 class cgnexp:
@@ -20,14 +202,43 @@ class cgnexp:
         """
         self.files = files if isinstance(files, list) else [files]
         self.results = []
+        self.failures = []
 
-    def run_experiments(self, metrics=None, save_images=False, save_folder='images/'):
+    def run_experiments(self, metrics=None, save_images=False, save_folder='images/', workers=None, timeout=None,
+                        store=None, trace_memory=False, measurement=None, centrality_cache=None):
         """
         Runs community detection experiments for the specified centrality metrics on each dataset.
 
         Args:
             metrics (list of str): List of centrality metrics to be tested. Defaults to a set list if None.
             save_images (bool): If True, saves visualizations for each metric and dataset.
+            workers (int): If greater than 1, runs every (dataset, metric) pair as a
+                task on this many worker processes. Results are still appended in
+                dataset, then metric order.
+            timeout (float): Per-task limit in seconds when running with workers. A
+                task that exceeds it, or whose worker crashes, is recorded in
+                ``self.failures`` and its worker is replaced. Tasks that raise are
+                recorded there as well, with or without workers.
+            store (str or ResultStore): JSON Lines file that every finished result is
+                written to as soon as it completes. Pairs already stored for the same
+                dataset contents, metric and library version are not run again.
+            trace_memory (bool): If True, also report the tracemalloc peak. Off by
+                default because tracing slows the run down severalfold.
+            measurement (callable): Factory for the measurement context manager of
+                each run; defaults to ``Measurement(trace_memory=trace_memory)``.
+                Must be picklable when running with workers.
+            centrality_cache (str or CentralityCache): Memoizes edge centralities by
+                edge set and metric, so repeated datasets and the identical early
+                rounds of repeated runs are not recomputed. A string is a directory
+                for an on-disk tier, which is the only tier workers share; it is
+                pruned to ``memo.DEFAULT_MAX_DISK_BYTES``, least recently used first.
+
+        The first iteration of every metric is computed before its measured
+        run (see ``cgnlib.compute_edge_centralities``), together for the
+        shortest-path metrics of a dataset (closeness, L1, betweenness) when
+        several are requested, since they share one traversal. Each run
+        reports its share of that work as 'Shared Time (s)'; its full cost
+        is that plus 'Wall Time (s)'.
         """
         if metrics is None:
             metrics = ['closeness', 'betweenness', 'pagerank', 'degree', 'bary']
@@ -35,54 +246,114 @@ class cgnexp:
         if save_images:
             os.makedirs(save_folder, exist_ok=True)
 
-        for file in self.files:
-            graph_data = cgnlib(file)
-            dataset_name = os.path.splitext(os.path.basename(file))[0]
-            
-            for metric in metrics:
-                try:
-                    print(f"Running experiment on {dataset_name} with {metric} centrality...")
-
-                    start_time = time.perf_counter()
-                    tracemalloc.start()
-
-                    communities = graph_data.detect_gn(method=metric)
-                    quality_metrics = graph_data.evaluate_community_quality()
-
-                    current, peak = tracemalloc.get_traced_memory()
-                    end_time = time.perf_counter()
-                    tracemalloc.stop()
-
-                    exec_time = round(end_time - start_time, 3)
-                    peak_memory = round(peak / 1024 / 1024, 2)  # MB
-                    print(f"      ✅ Done in {exec_time} sec, peak memory = {peak_memory} MB")
-
-
-                    modularity = quality_metrics.get("Modularity")
-                    average_conductance = quality_metrics.get("Average Conductance")
-                    min_conductance = quality_metrics.get("Min Conductance")
-                    max_conductance = quality_metrics.get("Max Conductance")
-                    coverage = quality_metrics.get("Coverage")
-                    num_communities = len(communities)
-                    
-                    self.results.append({
-                        'Dataset': dataset_name,
-                        'Centrality Metric': metric,
-                        'Modularity': modularity,
-                        'Average Conductance': average_conductance,
-                        'Min Conductance': min_conductance,
-                        'Max Conductance': max_conductance,
-                        'Coverage': coverage,
-                        'Number of Communities': num_communities
-                    })
-
-                    if save_images:
-                        image_filename = os.path.join(save_folder, f"{dataset_name}_{metric}.png")
-                        graph_data.visualize_best_communities(image_filename)
-                        print(f"Image saved as {image_filename}")
-
-                except ValueError as e:
-                    print(f"Error: {e}. Skipping {metric} centrality for {dataset_name}.")
+        if measurement is None:
+            measurement = functools.partial(Measurement, trace_memory=trace_memory)
+        options = {'save_images': save_images, 'save_folder': save_folder, 'measurement': measurement}
+
+        if isinstance(store, str):
+            store = ResultStore(store)
+        if isinstance(centrality_cache, str):
+            centrality_cache = CentralityCache(directory=centrality_cache)
+        tasks = [(file, metric) for file in self.files for metric in metrics]
+        results = {}
+        digests = {}
+        if store is not None:
+            digests = {file: file_digest(file).hex() for file in self.files}
+            for index, (file, metric) in enumerate(tasks):
+                cached = store.get(digests[file], metric)
+                if cached is not None:
+                    print(f"Using stored result for {_dataset_name(file)} with {metric} centrality.")
+                    results[index] = cached
+
+        def finished(index, result):
+            results[index] = result
+            if store is not None:
+                file, metric = tasks[index]
+                store.put(digests[file], metric, result)
+
+        remaining = [(index, file, metric) for index, (file, metric) in enumerate(tasks) if index not in results]
+        if workers is not None and workers > 1:
+            self._run_parallel(remaining, options, workers, timeout, finished, centrality_cache)
+        else:
+            self._run_sequential(remaining, options, finished, centrality_cache)
+
+        self.results.extend(results[index] for index in sorted(results))
+
+    def _run_sequential(self, tasks, options, finished, centrality_cache=None):
+        graphs = {}
+        for index, file, metric in tasks:
+            dataset_name = _dataset_name(file)
+            try:
+                if file not in graphs:
+                    graphs[file] = _load_graph(file, _shared_metrics([m for _, f, m in tasks if f == file]),
+                                               centrality_cache)
+                graph_data, shared_time = graphs[file]
+                _prime(graph_data, [metric], shared_time)
+                result = _run_experiment(graph_data, dataset_name, metric, shared_time=shared_time.get(metric, 0.0),
+                                         **options)
+            except Exception as e:
+                # Recorded like a failed worker task, so one bad pair does not end the sweep
+                reason = f"{type(e).__name__}: {e}"
+                print(f"Error: {reason}. Skipping {metric} centrality for {dataset_name}.")
+                self.failures.append({'Dataset': dataset_name, 'Centrality Metric': metric, 'Error': reason})
+                continue
+            finished(index, result)
+
+    def _run_parallel(self, tasks, options, workers, timeout, finished, centrality_cache=None):
+        shared = {file: _shared_metrics([m for _, f, m in tasks if f == file]) for _, file, _ in tasks}
+        pending = [(index, file, metric, shared[file], options) for index, file, metric in reversed(tasks)]
+        failures = {}
+        context = multiprocessing.get_context()
+        pool = [_ExperimentWorker(context, centrality_cache) for _ in range(min(workers, len(tasks)))]
+
+        def fail(task, reason):
+            index, file, metric, _, _ = task
+            print(f"Error: {reason}. Skipping {metric} centrality for {_dataset_name(file)}.")
+            failures[index] = {'Dataset': _dataset_name(file), 'Centrality Metric': metric, 'Error': reason}
+
+        try:
+            while pending or any(worker.task is not None for worker in pool):
+                for worker in pool:
+                    if worker.task is None and pending:
+                        worker.submit(pending.pop())
+
+                busy = [worker for worker in pool if worker.task is not None]
+                ready = wait([worker.connection for worker in busy] + [worker.process.sentinel for worker in busy],
+                             timeout=1.0)
+
+                for i, worker in enumerate(pool):
+                    if worker.task is None:
+                        continue
+                    if worker.connection in ready:
+                        try:
+                            index, status, payload = worker.connection.recv()
+                        except EOFError:
+                            worker.process.join(timeout=1)
+                        else:
+                            if status == 'ok':
+                                finished(index, payload)
+                            else:
+                                fail(worker.task, payload)
+                            worker.task = None
+                            continue
+
+                    timed_out = timeout is not None and time.monotonic() - worker.started > timeout
+                    if worker.process.is_alive() and not timed_out:
+                        continue
+
+                    # Crashed or hung: record the failure and replace the worker
+                    if worker.process.is_alive():
+                        reason = f"Timed out after {timeout} sec"
+                    else:
+                        reason = f"Worker exited with code {worker.process.exitcode}"
+                    fail(worker.task, reason)
+                    worker.kill()
+                    pool[i] = _ExperimentWorker(context, centrality_cache)
+        finally:
+            for worker in pool:
+                worker.stop()
+
+        self.failures.extend(failures[index] for index in sorted(failures))
 
     def print_results(self):
         """
@@ -97,6 +368,9 @@ class cgnexp:
             print(f"Max Conductance: {result['Max Conductance']}")
             print(f"Coverage: {result['Coverage']}")
             print(f"Number of Communities: {result['Number of Communities']}")
+            print(f"Wall Time (s): {result.get('Wall Time (s)')}")
+            print(f"CPU Time (s): {result.get('CPU Time (s)')}")
+            print(f"Shared Time (s): {result.get('Shared Time (s)')}")
             print()
     
     def export_results_to_csv(self, filename='experiment_results.csv'):
@@ -106,9 +380,11 @@ class cgnexp:
         Args:
             filename (str): The name of the file to save the results to. Defaults to 'experiment_results.csv'.
         """
+        # Columns added by a Measurement subclass follow the standard ones
+        fieldnames = list(RESULT_FIELDS)
+        for result in self.results:
+            fieldnames.extend(key for key in result if key not in fieldnames)
         with open(filename, mode='w', newline='') as file:
-            fieldnames = ['Dataset', 'Centrality Metric', 'Modularity', 'Average Conductance',
-                          'Min Conductance', 'Max Conductance', 'Coverage', 'Number of Communities']
             writer = csv.DictWriter(file, fieldnames=fieldnames)
             writer.writeheader()
             for result in self.results:
@@ -2,34 +2,125 @@ import networkx as nx
 import netcenlib as ncl
 import matplotlib.pyplot as plt
 import csv
+import heapq
+import random
+import time
+import weakref
+from collections import deque
 from networkx.algorithms.community import girvan_newman
 from scipy.sparse import csr_matrix
-from scipy.sparse.linalg import eigsh
-
+from cgnlib.linegraph import LineGraph
+from cgnlib.graphcache import load_cached_graph
+from cgnlib.graphcore import GraphCore
+from cgnlib.distances import distance_sums
+from cgnlib.edgeformulas import EDGE_FORMULAS, edge_formula_centrality
+from cgnlib.energy import graph_energy, node_deletion_energies, perturbation_energy_drops
+from cgnlib.modularity import ModularityTracker
+from cgnlib.dendrogram import Dendrogram
+from cgnlib.stopping import FirstDrop, IterationState
+from cgnlib.removal import MaxTies
+from cgnlib.measure import PhaseTimer
+from cgnlib.trace import IterationEvent
+from cgnlib.quality import partition_quality
+from cgnlib.drawing import LARGE_GRAPH_NODES, compute_layout, draw_large_graph
+from cgnlib.igraph_engine import IGRAPH_METRICS, IgraphEdgeGraph, edge_betweenness, line_graph_centrality
+from cgnlib.workers import WorkerPool
+
+# Number of independent pivot samples averaged by the approximate (approx=k) mode
+APPROX_SAMPLE_BATCHES = 4
+
+# Metrics whose line-graph scores depend only on the node's own connected
+# component, up to a normalization over the whole graph
+COMPONENT_LOCAL_METRICS = ('closeness', 'betweenness', 'degree', 'l1')
+
+ENGINES = ('networkx', 'igraph')
+
+# Shortest-path metrics that compute_edge_centralities derives from one shared
+# traversal. Harmonic is left out: NetworkX sums it over sources in set order,
+# which a traversal shared with betweenness (summed in node order) cannot follow.
+FUSED_METRICS = ('closeness', 'l1', 'betweenness')
+
+# detect_gn methods that run their own Girvan-Newman instead of a centrality
+GIRVAN_NEWMAN_METHODS = ('Girvan-Newman', 'Girvan-Newman-incremental')
 
 
 class cgnlib:
-    def __init__(self, file, method="closeness"):
+    def __init__(self, file, method="closeness", workers=None, cache=True, engine="networkx", sparse_bfs=False,
+                 centrality_cache=None):
+        if engine not in ENGINES:
+            raise ValueError(f"Unsupported engine: {engine}. Choose one of {ENGINES}.")
         self.file = file
         self.method = method
+        self.workers = workers
+        self.cache = cache
+        self.engine = engine  # 'igraph' computes closeness and betweenness in C; ties may break differently
+        self.sparse_bfs = sparse_bfs  # Batch L1 distance sums as sparse matrix products
+        self.centrality_cache = centrality_cache  # Optional cgnlib.memo.CentralityCache shared across runs
         self.best_communities = None
-        self.GraphSet = self._create_graph_from(file)
+        self.edge_list = None  # Parsed input file (cgnlib.loader.EdgeList); None once GraphSet is assigned
+        self.timings = PhaseTimer()  # Seconds per phase of the last detect_gn run
+        self._layouts = {}  # Layout method to node positions of the input graph
+        self._quality_arrays = None  # Edge arrays of the input graph for evaluate_community_quality
+        self.initial_centrality = {}  # Metric to edge centralities of the input graph, see compute_edge_centralities
+        self._graph_set = None
+        self._pool = None  # WorkerPool of self.workers processes, started by the first parallel computation
+        self.core = self._create_graph_from(file)  # Compact array-backed graph that detect_gn runs on
+
+    def _worker_pool(self):
+        """
+        Returns the process pool shared by the parallel computations of this
+        instance, or None when ``self.workers`` asks for none. The pool is
+        shut down by ``close()`` or when the instance is garbage collected.
+        """
+        if not self.workers or self.workers <= 1:
+            return None
+        if self._pool is None or self._pool.workers != self.workers:
+            self.close()
+            self._pool = WorkerPool(self.workers)
+            weakref.finalize(self, self._pool.close)
+        return self._pool
+
+    def close(self):
+        """
+        Shuts down the worker processes, if any were started.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def _create_graph_from(self, file):
-        G = nx.Graph()
         try:
-            with open(file, 'r') as file:
-                for line in file.readlines():
-                    parts = line.strip().split(' ')
-                    if len(parts) != 2:
-                        raise ValueError("Each line must contain exactly two nodes separated by a space.")
-                    source, target = parts
-                    G.add_edge(source, target)
+            self.edge_list, core = load_cached_graph(file, cache=self.cache)
         except Exception as e:
             print(f"Error importing graph: {e}")
-            print("Please ensure the input file is in the correct format with each line containing exactly two nodes separated by a space.")
+            print("Please ensure the input file is in the correct format with each line containing two nodes separated by whitespace, optionally followed by a weight.")
             return None
-        return G
+        return core
+
+    @property
+    def GraphSet(self):
+        """
+        The input graph as an ``nx.Graph``, built from ``self.core`` on first use.
+        """
+        if self._graph_set is None and self.core is not None:
+            self._graph_set = self.core.to_networkx()
+        return self._graph_set
+
+    @GraphSet.setter
+    def GraphSet(self, graph):
+        # Everything derived from the previous graph goes with it
+        self._graph_set = graph
+        self.core = None if graph is None else GraphCore.from_networkx(graph)
+        self.edge_list = None
+        self._layouts = {}
+        self._quality_arrays = None
+        self.initial_centrality = {}
     
     
     def coverage(self, graph, clusters):
@@ -46,62 +137,63 @@ class cgnlib:
         L1(v) = 1 - (D(v) - D_min) / (D_max - D_min),
         where D(v) is the sum of shortest path lengths from node v.
         """
-        all_distances = dict(nx.all_pairs_shortest_path_length(graph))
-        total_distance = {}
-
-        for node, distances in all_distances.items():
-            total_distance[node] = sum(distances.values())
+        return self._l1_from_distances(self._distance_sums(graph))
 
+    def _distance_sums(self, graph):
+        """
+        Sums shortest path lengths per node without keeping all-pairs distances;
+        see ``cgnlib.distances.distance_sums``.
+        """
+        if len(graph) == 0:
+            return {}  # Line graph of an isolated node; NetworkX cannot convert it to a matrix
+        nodes = list(graph)
+        A = nx.to_scipy_sparse_array(graph, nodelist=nodes, weight=None, format='csr')
+        sums = distance_sums(A, sparse=self.sparse_bfs, pool=self._worker_pool())
+        return dict(zip(nodes, sums.tolist()))
+
+    def _l1_from_distances(self, total_distance):
         D_values = list(total_distance.values())
         D_min = min(D_values)
         D_max = max(D_values)
 
         l1_scores = {}
-        for node in graph.nodes():
+        for node in total_distance:
             if D_max == D_min:
                 l1_scores[node] = 1.0
             else:
                 l1_scores[node] = 1 - ((total_distance[node] - D_min) / (D_max - D_min))
         return l1_scores
     
-    def _gec_centrality(self, graph):
+    def _gec_centrality(self, graph, approximate=False):
         """
         Computes Graph Energy Centrality (GEC) for all nodes.
         GEC(v) = E(G) - E(G - v), where E is the sum of absolute eigenvalues.
+
+        The exact path slices one shared CSR matrix per node and runs the
+        eigensolves on ``self.workers`` processes. With ``approximate=True``
+        the energy drops are estimated from a single eigendecomposition by
+        first-order perturbation (see ``energy.perturbation_energy_drops``);
+        the normalized error bound of each score is kept in ``self.gec_error_bounds``.
         """
         import numpy as np
 
-        def graph_energy(G):
-            #A = nx.to_numpy_array(G)
-            #eigenvalues = np.linalg.eigvals(A)
-            try:
-                A = nx.to_scipy_sparse_array(G, format='csr').astype(float)
-                k = min(10, A.shape[0] - 1)
-                if k < 1:
-                    return 0.0
-                eigenvalues = eigsh(A, k=k, return_eigenvectors=False)
-                return np.sum(np.abs(eigenvalues))
-            except Exception as e:
-                print("⚠️ Fallback to dense eigvals due to:", e)
-                A_dense = nx.to_numpy_array(G).astype(float)
-                eigenvalues = np.linalg.eigvals(A_dense)
-                return np.sum(np.abs(eigenvalues))
-        base_energy = graph_energy(graph)
-        gec_scores = {}
+        nodes = list(graph.nodes())
+        A = nx.to_scipy_sparse_array(graph, nodelist=nodes, format='csr').astype(float)
 
-        for node in graph.nodes():
-            G_minus_v = graph.copy()
-            G_minus_v.remove_node(node)
-            reduced_energy = graph_energy(G_minus_v)
-            gec_scores[node] = base_energy - reduced_energy
+        if approximate:
+            drops, bounds = perturbation_energy_drops(A)
+        else:
+            drops = graph_energy(A) - node_deletion_energies(A, pool=self._worker_pool())
+            bounds = np.zeros(len(nodes))
 
         # Normalize to [0, 1]
-        max_score = max(gec_scores.values())
+        max_score = drops.max() if len(nodes) else 0
         if max_score > 0:
-            for node in gec_scores:
-                gec_scores[node] /= max_score
+            drops = drops / max_score
+            bounds = bounds / max_score
 
-        return gec_scores
+        self.gec_error_bounds = {node: float(bounds[i]) for i, node in enumerate(nodes)}
+        return {node: float(drops[i]) for i, node in enumerate(nodes)}
 
 
     def _tworw_centrality(self, graph):
@@ -112,29 +204,24 @@ class cgnlib:
         import numpy as np
 
         nodes = list(graph.nodes())
-        n = len(nodes)
         node_index = {node: i for i, node in enumerate(nodes)}
 
-        A = nx.to_numpy_array(graph, nodelist=nodes)
-        degrees = A.sum(axis=1)
-
-        # Build transition matrix P: P[i][j] = 1/deg(i) if (i,j) is an edge
-        P = np.zeros((n, n))
-        for i in range(n):
-            for j in range(n):
-                if A[i][j] == 1:
-                    P[i][j] = 1 / degrees[i] if degrees[i] > 0 else 0
+        A = nx.to_scipy_sparse_array(graph, nodelist=nodes, format='csr').astype(float)
+        degrees = np.asarray(A.sum(axis=1)).ravel()
 
-        # Compute two-step transition matrix
-        P2 = np.matmul(P, P)
+        # Build sparse transition matrix P: P[i][j] = 1/deg(i) if (i,j) is an edge
+        P = A.copy()
+        P.data = (P.data == 1).astype(float)
+        row_degrees = np.repeat(degrees, np.diff(P.indptr))
+        P.data = np.divide(P.data, row_degrees, out=np.zeros_like(P.data), where=row_degrees > 0)
 
-        # Sum over all (i, j) pairs: total probability of visiting k
-        scores = np.zeros(n)
-        for i in range(n):
-            for j in range(n):
-                if i != j:
-                    for k in range(n):
-                        scores[k] += P[i][k] * P[k][j]  # probability of passing through k on i->j trip
+        # Sum over all (i, j) pairs with i != j of P[i][k] * P[k][j]: the full
+        # double sum factors into column sum times row sum of P, minus the
+        # i == j round trips, which are the diagonal of P @ P
+        in_flow = np.asarray(P.sum(axis=0)).ravel()
+        out_flow = np.asarray(P.sum(axis=1)).ravel()
+        round_trips = np.asarray(P.multiply(P.T).sum(axis=1)).ravel()
+        scores = in_flow * out_flow - round_trips
 
         # Normalize to [0, 1]
         max_score = np.max(scores)
@@ -165,42 +252,300 @@ class cgnlib:
         return scores
 
 
-    def _calculate_centrality_for_edges(self, G, metric='closeness'):
-        edge_to_node = {edge: i for i, edge in enumerate(G.edges(), 1)}
-        H = nx.Graph()
+    def _sampled_distance_sums(self, graph, k, rng):
+        """
+        Estimates, for every node, the sum of shortest path lengths to the
+        nodes of its component from BFS runs out of sampled pivots.
 
-        for edge1 in G.edges():
-            H.add_node(edge_to_node[edge1])
-            for edge2 in G.edges():
-                if edge1 != edge2 and len(set(edge1) & set(edge2)) > 0:
-                    H.add_edge(edge_to_node[edge1], edge_to_node[edge2])
+        Pivots are drawn per component in proportion to its size, with at
+        least two per component so every node has a pivot other than itself.
+        """
+        n = graph.number_of_nodes()
+        component_size = {}
+        pivots = []
+        for component in nx.connected_components(graph):
+            for node in component:
+                component_size[node] = len(component)
+            if len(component) > 1:
+                count = min(len(component), max(2, round(k * len(component) / n)))
+                pivots.extend(rng.sample(sorted(component, key=str), count))
+
+        distance_sum = dict.fromkeys(graph, 0)
+        pivot_hits = dict.fromkeys(graph, 0)
+        for source in pivots:
+            for node, distance in nx.single_source_shortest_path_length(graph, source).items():
+                if node != source:
+                    distance_sum[node] += distance
+                    pivot_hits[node] += 1
+
+        return {
+            node: distance_sum[node] * (component_size[node] - 1) / pivot_hits[node] if pivot_hits[node] else 0
+            for node in graph
+        }, component_size
+
+    def _sampled_centrality(self, graph, metric, k, rng):
+        """
+        Computes one pivot-sampled estimate of a node centrality from k sources.
+        """
+        if metric == 'betweenness':
+            return nx.betweenness_centrality(graph, k=min(k, graph.number_of_nodes()), seed=rng)
 
-        centrality = None
+        total_distance, component_size = self._sampled_distance_sums(graph, k, rng)
         if metric == 'closeness':
-            centrality = nx.closeness_centrality(H)
+            # Same normalization as nx.closeness_centrality(wf_improved=True)
+            n = graph.number_of_nodes()
+            return {
+                node: (component_size[node] - 1) ** 2 / (total_distance[node] * (n - 1)) if total_distance[node] > 0 else 0.0
+                for node in graph
+            }
+        if metric == 'l1':
+            return self._l1_from_distances(total_distance)
+        raise ValueError(f"Approximate mode is not supported for metric: {metric}")
+
+    def _uses_igraph(self, metric, approx=None):
+        return self.engine == 'igraph' and approx is None and metric in IGRAPH_METRICS
+
+    def _memoized_centrality(self, G, metric, compute):
+        """
+        Returns ``compute()``, going through ``self.centrality_cache`` when one is set.
+        """
+        if self.centrality_cache is None:
+            return compute()
+        key = f"igraph-{metric}" if self._uses_igraph(metric) else metric  # igraph scores differ in the last bits
+        centrality = self.centrality_cache.get(G, key)
+        if centrality is None:
+            centrality = compute()
+            self.centrality_cache.put(G, key, centrality)
+        return centrality
+
+    def _calculate_centrality_for_edges(self, G, metric='closeness', line_graph=None, approx=None, seed=None):
+        if approx is None and metric in EDGE_FORMULAS:
+            return edge_formula_centrality(G, metric)  # O(E) from node degrees, cheaper than any cache lookup
+        if approx is None:
+            return self._memoized_centrality(G, metric, lambda: self._compute_centrality_for_edges(G, metric, line_graph))
+        return self._compute_centrality_for_edges(G, metric, line_graph, approx, seed)
+
+    def _compute_centrality_for_edges(self, G, metric='closeness', line_graph=None, approx=None, seed=None):
+        if self._uses_igraph(metric, approx):
+            if not isinstance(line_graph, IgraphEdgeGraph):
+                with self.timings.phase('line_graph'):
+                    line_graph = IgraphEdgeGraph.from_graph(G)
+            with self.timings.phase('line_graph'):
+                H = line_graph.line_graph()
+            centrality = dict(zip(line_graph.edges, line_graph_centrality(H, metric)))
+            return {edge: centrality[edge] for edge in G.edges()}
+
+        if line_graph is None:
+            with self.timings.phase('line_graph'):
+                line_graph = LineGraph.from_graph(G)
+        with self.timings.phase('line_graph'):
+            H, edge_to_node = line_graph.to_networkx()
+
+        if approx is not None:
+            # Average independent pivot samples; the per-sample scores are kept
+            # so callers can check how stable the chosen edges are
+            rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+            batch_size = max(1, approx // APPROX_SAMPLE_BATCHES)
+            samples = [self._sampled_centrality(H, metric, batch_size, rng) for _ in range(APPROX_SAMPLE_BATCHES)]
+            self.centrality_samples = [{edge: sample[edge_to_node[edge]] for edge in G.edges()} for sample in samples]
+            return {edge: sum(sample[edge] for sample in self.centrality_samples) / len(samples) for edge in G.edges()}
+
+        centrality = self._node_centrality(H, metric)
+        centrality_edge_mapping = {edge: centrality[edge_to_node[edge]] for edge in G.edges()}
+        return centrality_edge_mapping
+
+    def _node_centrality(self, H, metric):
+        """
+        Computes a node centrality of the line graph H.
+        """
+        if metric == 'closeness':
+            return nx.closeness_centrality(H)
         elif metric == 'betweenness':
-            centrality = nx.betweenness_centrality(H)
+            return nx.betweenness_centrality(H)
         elif metric == 'pagerank':
-            centrality = nx.pagerank(H)
+            return nx.pagerank(H)
         elif metric == 'degree':
-            centrality = dict(H.degree())
+            return dict(H.degree())
         elif metric == 'l1':
-            centrality = self._l1_centrality(H)
+            return self._l1_centrality(H)
         elif metric == 'tworw':
-            centrality = self._tworw_centrality(H)
+            return self._tworw_centrality(H)
         elif metric == 'gec':
-            centrality = self._gec_centrality(H)
+            return self._gec_centrality(H)
+        elif metric == 'gec_approx':
+            return self._gec_centrality(H, approximate=True)
         elif metric == 'isolating':
-            centrality = self._isolating_centrality(H)
-
+            return self._isolating_centrality(H)
         elif hasattr(ncl.algorithms, f'{metric}_centrality'):
             centrality_func = getattr(ncl.algorithms, f'{metric}_centrality')
-            centrality = centrality_func(H)
-        else:
-            raise ValueError(f"Unsupported metric: {metric}")
+            return centrality_func(H)
+        raise ValueError(f"Unsupported metric: {metric}")
 
-        centrality_edge_mapping = {edge: centrality[edge_to_node[edge]] for edge in G.edges()}
-        return centrality_edge_mapping
+    def _fused_path_centralities(self, H, metrics):
+        """
+        Computes several shortest-path metrics of H from a single BFS per source.
+
+        Each BFS records distances, path counts and predecessors the way
+        NetworkX's Brandes implementation does, and feeds the closeness, L1
+        and betweenness accumulators at once. Sources are visited in node
+        order, so all three are bit-identical to their separate computations.
+
+        Returns:
+            dict: Metric name to node scores, for every metric in ``metrics``.
+        """
+        n = len(H)
+        reachable = {}
+        total_distance = {}
+        betweenness = dict.fromkeys(H, 0.0)
+        for s in H:
+            stack = []
+            predecessors = {v: [] for v in H} if 'betweenness' in metrics else None
+            sigma = dict.fromkeys(H, 0.0)
+            distance = {s: 0}
+            sigma[s] = 1.0
+            queue = deque([s])
+            while queue:
+                v = queue.popleft()
+                stack.append(v)
+                dv = distance[v]
+                sigmav = sigma[v]
+                for w in H[v]:
+                    if w not in distance:
+                        queue.append(w)
+                        distance[w] = dv + 1
+                    if predecessors is not None and distance[w] == dv + 1:
+                        sigma[w] += sigmav
+                        predecessors[w].append(v)
+            reachable[s] = len(distance)
+            total_distance[s] = sum(distance.values())
+            if predecessors is not None:
+                delta = dict.fromkeys(stack, 0)
+                while stack:
+                    w = stack.pop()
+                    coeff = (1 + delta[w]) / sigma[w]
+                    for v in predecessors[w]:
+                        delta[v] += sigma[v] * coeff
+                    if w != s:
+                        betweenness[w] += delta[w]
+
+        scores = {}
+        if 'closeness' in metrics:
+            parts = {node: (reachable[node], total_distance[node]) for node in H}
+            scores['closeness'] = self._combine_local_centrality(parts, 'closeness', n)
+        if 'l1' in metrics:
+            scores['l1'] = self._l1_from_distances(total_distance)
+        if 'betweenness' in metrics:
+            if n > 2:
+                scale = 1 / ((n - 1) * (n - 2))
+                betweenness = {node: value * scale for node, value in betweenness.items()}
+            scores['betweenness'] = betweenness
+        return scores
+
+    def compute_edge_centralities(self, G=None, metrics=('closeness',)):
+        """
+        Computes several edge centralities from one shared line graph.
+
+        The line graph is built once for all metrics, and the shortest-path
+        metrics (closeness, L1, betweenness) share one BFS per source when more
+        than one of them is requested. Metrics with a direct edge formula (see
+        ``cgnlib.edgeformulas``) are computed without it. Called without ``G``,
+        the scores of the input graph are also kept in ``self.initial_centrality``
+        and reused for the first iteration of ``detect_gn``.
+
+        Args:
+            G (nx.Graph): Graph whose edges are scored. Defaults to the input graph.
+            metrics (list of str): Metrics as accepted by ``detect_gn``.
+
+        Returns:
+            dict: Metric name to a dict of edge centralities.
+        """
+        initial = G is None
+        if initial:
+            G = self.core
+        centralities = {}
+        with self.timings.phase('centrality'):
+            for metric in metrics:
+                if metric in EDGE_FORMULAS:
+                    centralities[metric] = edge_formula_centrality(G, metric)
+        line_graph_metrics = [metric for metric in metrics if metric not in centralities]
+
+        if line_graph_metrics:
+            with self.timings.phase('line_graph'):
+                H, edge_to_node = LineGraph.from_graph(G).to_networkx()
+
+            fused = [metric for metric in line_graph_metrics if metric in FUSED_METRICS]
+            with self.timings.phase('centrality'):
+                node_scores = self._fused_path_centralities(H, fused) if len(fused) > 1 else {}
+                for metric in line_graph_metrics:
+                    if metric not in node_scores:
+                        node_scores[metric] = self._node_centrality(H, metric)
+
+            edges = list(G.edges())
+            for metric in line_graph_metrics:
+                centralities[metric] = {edge: node_scores[metric][edge_to_node[edge]] for edge in edges}
+        centralities = {metric: centralities[metric] for metric in metrics}
+        if initial:
+            self.initial_centrality.update(centralities)
+        return centralities
+
+    def _local_centrality_parts(self, H, metric):
+        """
+        Computes the unnormalized per-node parts of a component-local metric on one component.
+        """
+        if metric == 'closeness':
+            return {node: (len(sp), sum(sp.values())) for node, sp in nx.all_pairs_shortest_path_length(H)}
+        if metric == 'betweenness':
+            return nx.betweenness_centrality(H, normalized=False)
+        if metric == 'degree':
+            return dict(H.degree())
+        if metric == 'l1':
+            return self._distance_sums(H)
+        raise ValueError(f"Unsupported component-local metric: {metric}")
+
+    def _combine_local_centrality(self, parts, metric, n):
+        """
+        Turns per-component parts into the scores the metric gives on the
+        whole n-node line graph, using the same float operations as NetworkX.
+        """
+        if metric == 'closeness':
+            scores = {}
+            for edge, (reachable, totsp) in parts.items():
+                score = 0.0
+                if totsp > 0.0 and n > 1:
+                    score = (reachable - 1.0) / totsp
+                    score *= (reachable - 1.0) / (n - 1)
+                scores[edge] = score
+            return scores
+        if metric == 'betweenness':
+            # normalized=False halves undirected scores; undo it before rescaling
+            scale = 1 / ((n - 1) * (n - 2)) if n > 2 else 1
+            return {edge: value * 2 * scale for edge, value in parts.items()}
+        if metric == 'degree':
+            return dict(parts)
+        if metric == 'l1':
+            return self._l1_from_distances(parts)
+        raise ValueError(f"Unsupported component-local metric: {metric}")
+
+    def _calculate_local_centrality_for_edges(self, G, components, metric, line_graph, cache):
+        """
+        Computes edge centrality component by component, reusing cached parts.
+
+        Args:
+            components (dict): Maps a component id to the set of its nodes in G.
+            cache (dict): Maps a component id to the parts of its edges. Entries
+                must be dropped by the caller once edges of that component are removed.
+        """
+        parts = {}
+        for key, component in components.items():
+            if key not in cache:
+                with self.timings.phase('line_graph'):
+                    H, edge_to_node = line_graph.to_networkx(G.edges(component))
+                node_parts = self._local_centrality_parts(H, metric)
+                cache[key] = {edge: node_parts[node] for edge, node in edge_to_node.items()}
+            parts.update(cache[key])
+
+        centrality = self._combine_local_centrality(parts, metric, len(line_graph))
+        return {edge: centrality[edge] for edge in G.edges()}
 
     def detect_classic_gn(self):
         graph = self.GraphSet.copy()  # Copy of the original graph to work with
@@ -210,50 +555,204 @@ class cgnlib:
         self.best_communities = classic_communities 
         return classic_communities
 
-    def detect_gn(self, method='closeness'):
-
-        if method=='Girvan-Newman':
-            return self.detect_classic_gn()
-
+    def detect_incremental_gn(self):
+        """
+        Runs classic Girvan-Newman on edge betweenness down to single nodes
+        and returns the partition of highest modularity.
+
+        Betweenness is kept per connected component and only recomputed for
+        the component that lost an edge (both halves if it split), so every
+        removal costs one betweenness pass over a single component instead
+        of the whole graph. The component holding the highest score is found
+        with a heap. Every removal and split is recorded in ``self.dendrogram``.
+        With ``engine='igraph'`` the betweenness passes run in igraph.
+        """
+        self.timings.reset()
         graph = self.GraphSet.copy()
+        with self.timings.phase('modularity'):
+            tracker = ModularityTracker(self.GraphSet)
+            self.dendrogram = Dendrogram(self.GraphSet, tracker.membership, tracker.modularity())
+        heap = []  # One (-max betweenness, first node position, component id, edge) entry per component with edges
+
+        def update(cid):
+            component = graph.subgraph(tracker.components[cid]).copy()  # Views make the BFS several times slower
+            if component.number_of_edges() == 0:
+                return
+            with self.timings.phase('centrality'):
+                if self.engine == 'igraph':
+                    scores = edge_betweenness(component)
+                else:
+                    scores = nx.edge_betweenness_centrality(component, normalized=False)
+            edge = max(scores, key=scores.get)
+            heapq.heappush(heap, (-scores[edge], tracker.first[cid], cid, edge))
+
+        for cid in list(tracker.components):
+            update(cid)
+
+        iteration = 0
+        while heap:
+            _, _, cid, (u, v) = heapq.heappop(heap)
+            graph.remove_edge(u, v)
+            with self.timings.phase('modularity'):
+                self.dendrogram.record_removal(iteration, u, v)
+                split = tracker.remove_edge(graph, u, v)
+                if split is not None:
+                    self.dendrogram.record_split(iteration, *split, tracker.modularity())
+            if split is not None:
+                update(split[1])
+            update(cid)
+            iteration += 1
+
+        self.dendrogram.finish(tracker.membership)
+        self.best_communities = self.dendrogram.cut(self.dendrogram.best_level())
+        return self.best_communities
+
+    def detect_gn(self, method='closeness', approx=None, seed=None, stop=None, observers=None, removal=None):
+        """
+        Detects communities by repeatedly removing the edges of maximum centrality.
+
+        Every removed edge and every split is recorded in ``self.dendrogram``,
+        from which any level of the hierarchy can be extracted afterwards.
+
+        Args:
+            method (str): Centrality metric computed on the line graph.
+            approx (int): If given, estimate 'betweenness', 'closeness' or 'l1'
+                from about this many sampled pivot sources per iteration instead
+                of computing them exactly. The fraction of samples that agree
+                on the removed edges is recorded per iteration in ``self.approx_stability``.
+            seed (int): Seed for the pivot sampling.
+            stop (callable): Stopping policy called with an ``IterationState``
+                before each round; see ``cgnlib.stopping``. Defaults to
+                ``FirstDrop()``, which stops at the first modularity drop.
+                The run also ends once no edges are left.
+            observers (list): Callables called with an ``IterationEvent`` after
+                each removal round, e.g. a ``cgnlib.trace.TraceRecorder``.
+                Nothing is measured per round when no observer is given.
+            removal (callable): Removal policy choosing the edges removed in each
+                round; see ``cgnlib.removal``. Defaults to ``MaxTies()``, which
+                removes the edges of exactly maximal centrality. ``NearTies``,
+                ``TopK``, ``TopFraction`` and ``OnePerComponent`` remove more
+                edges per round, trading Girvan-Newman fidelity for fewer rounds.
+        """
+        self.timings.reset()
+        if method=='Girvan-Newman':
+            return self.detect_classic_gn()  # Runs inside NetworkX, so no phases are recorded
+        if method=='Girvan-Newman-incremental':
+            return self.detect_incremental_gn()
+
+        if stop is None:
+            stop = FirstDrop()
+        if removal is None:
+            removal = MaxTies()
+        start_time = time.perf_counter()
+        rng = random.Random(seed)
+        self.approx_stability = []
+        graph = self.core.copy()  # O(1); removals only touch the copy's alive mask
+        direct = approx is None and method in EDGE_FORMULAS  # Scored from the edge list, no line graph needed
+        use_igraph = not direct and self._uses_igraph(method, approx)
+        line_graph = None
+        if not direct:
+            with self.timings.phase('line_graph'):
+                # Kept in sync with graph across iterations
+                line_graph = IgraphEdgeGraph.from_graph(graph) if use_igraph else LineGraph.from_graph(graph)
+        with self.timings.phase('modularity'):
+            tracker = ModularityTracker(self.core)  # Components and modularity, updated only on splits
+            self.dendrogram = Dendrogram(self.core, tracker.membership, tracker.modularity())
+        component_cache = {}  # Centrality parts of components untouched since they were computed
+        use_component_cache = not direct and not use_igraph and approx is None and method in COMPONENT_LOCAL_METRICS
         best_modularity = -1
         best_communities = []
+        best_splits = None
+        iteration = 0
+        iterations_since_best = 0
         while True:
-            communities = list(nx.connected_components(graph))
-            current_modularity = round(nx.community.modularity(self.GraphSet, communities), 4)
+            with self.timings.phase('modularity'):
+                current_modularity = round(tracker.modularity(), 4)
 
             if current_modularity >= best_modularity:
                 best_modularity = current_modularity
-                best_communities = communities
+                iterations_since_best = 0
+                if tracker.splits != best_splits:
+                    with self.timings.phase('modularity'):
+                        best_communities = tracker.communities()
+                    best_splits = tracker.splits
+            else:
+                iterations_since_best += 1
 
-            if current_modularity < best_modularity:
+            state = IterationState(iteration, current_modularity, best_modularity, iterations_since_best,
+                                   len(tracker.components), time.perf_counter() - start_time)
+            if stop(state) or graph.number_of_edges() == 0:
                 break
 
-            edge_centrality = self._calculate_centrality_for_edges(graph, metric=method)
-            max_centrality = max(edge_centrality.values())
-
-            edges_with_max_centrality = [edge for edge, centrality in edge_centrality.items() if centrality == max_centrality]
-            graph.remove_edges_from(edges_with_max_centrality)
-
+            if observers:
+                round_start = time.perf_counter()
+                totals_before = dict(self.timings.totals)
+            with self.timings.phase('centrality'):
+                if iteration == 0 and approx is None and not use_igraph and method in self.initial_centrality:
+                    edge_centrality = self.initial_centrality[method]
+                elif use_component_cache:
+                    edge_centrality = self._memoized_centrality(
+                        graph, method,
+                        lambda: self._calculate_local_centrality_for_edges(graph, tracker.components, method,
+                                                                           line_graph, component_cache))
+                else:
+                    edge_centrality = self._calculate_centrality_for_edges(graph, metric=method, line_graph=line_graph,
+                                                                          approx=approx, seed=rng)
+            removed_edges = removal(edge_centrality, tracker.membership)
+            if approx is not None:
+                # A sample agrees if the policy applied to it alone would also remove these edges
+                agreeing = sum(set(removed_edges) <= set(removal(sample, tracker.membership))
+                               for sample in self.centrality_samples)
+                self.approx_stability.append(agreeing / len(self.centrality_samples))
+            with self.timings.phase('modularity'):
+                for u, v in removed_edges:
+                    graph.remove_edge(u, v)
+                    self.dendrogram.record_removal(iteration, u, v)
+                    split = tracker.remove_edge(graph, u, v)
+                    if split is not None:
+                        self.dendrogram.record_split(iteration, *split, tracker.modularity())
+            if line_graph is not None:
+                with self.timings.phase('line_graph'):
+                    line_graph.remove_edges(removed_edges)
+            for node in {node for edge in removed_edges for node in edge}:
+                component_cache.pop(tracker.membership[node], None)
+            if observers:
+                self._notify(observers, IterationEvent(
+                    iteration, len(removed_edges), len(tracker.components), tracker.modularity(),
+                    round_start - start_time, time.perf_counter() - round_start,
+                    *(self.timings.totals.get(phase, 0.0) - totals_before.get(phase, 0.0)
+                      for phase in ('line_graph', 'centrality', 'modularity'))))
+            iteration += 1
+
+        self.dendrogram.finish(tracker.membership)
         self.best_communities = best_communities
         return best_communities
 
+    @staticmethod
+    def _notify(observers, event):
+        for observer in observers:
+            observer(event)
+
     def evaluate_community_quality(self):
+        """
+        Computes modularity, coverage and the conductance of every community
+        of ``self.best_communities`` in a single vectorized pass over the edges.
+        """
         if self.best_communities is None:
             return None
 
-        communities = self.best_communities
-        G = self.GraphSet
+        import numpy as np
 
-        modularity = nx.community.modularity(G, communities)
+        communities = self.best_communities
+        if self._quality_arrays is None:
+            self._quality_arrays = self.core.edge_arrays()  # The input graph never changes
+        nodes, src, dst, weights = self._quality_arrays
+        community_of = {node: label for label, community in enumerate(communities) for node in community}
+        labels = np.fromiter((community_of[node] for node in nodes), dtype=np.int64, count=len(nodes))
+        quality = partition_quality(labels, src, dst, weights)
 
-        conductances = []
-        for community in communities:
-            if len(community) == len(G.nodes):
-                conductance = None
-            else:
-                conductance = nx.algorithms.cuts.conductance(G, community)
-            conductances.append(conductance)
+        modularity = quality['modularity']
+        conductances = [None if np.isnan(c) else c for c in quality['conductance'].tolist()]
 
         # Filter out None values to calculate metrics
         valid_conductances = [c for c in conductances if c is not None]
@@ -264,8 +763,7 @@ class cgnlib:
         else:
             average_conductance = min_conductance = max_conductance = None
 
-        # Calculate coverage
-        coverage_metric = self.coverage(G, communities)
+        coverage_metric = quality['coverage']
 
         # Add metrics to the dictionary
         metrics = {
@@ -280,20 +778,38 @@ class cgnlib:
         return metrics
 
 
-    def visualize_best_communities(self, save_path=None):
-        if self.best_communities is None:
-            print("No communities detected. Please run the detect_gn method first.")
-            return
-
-        pos = nx.spring_layout(self.GraphSet)
+    def _cached_layout(self, layout):
+        # Layouts depend only on the input graph, so every metric and both
+        # visualizations reuse one per method; the community layout depends on the partition
+        if layout == 'community':
+            return compute_layout(self.GraphSet, layout, communities=self.best_communities)
+        if layout not in self._layouts:
+            self._layouts[layout] = compute_layout(self.GraphSet, layout)
+        return self._layouts[layout]
+
+    def _draw_communities(self, save_path, layout, large, node_attr=None):
+        if large is None:
+            large = len(self.GraphSet) > LARGE_GRAPH_NODES
+        if layout is None:
+            layout = 'grid' if large else 'spring'
+        pos = self._cached_layout(layout)
         colors = plt.get_cmap('tab10')
 
-        for i, community in enumerate(self.best_communities):
-            nx.draw_networkx_nodes(self.GraphSet, pos, nodelist=list(community), node_color=[colors(i)], label=f'Community {i}')
-        nx.draw_networkx_edges(self.GraphSet, pos)
-        nx.draw_networkx_labels(self.GraphSet, pos)
-
-        plt.legend()
+        if large:
+            node_sizes = None if node_attr is None else {node: value * 100 for node, value in node_attr.items()}
+            draw_large_graph(self.GraphSet, pos, self.best_communities, node_sizes)
+        else:
+            for i, community in enumerate(self.best_communities):
+                if node_attr is None:
+                    nx.draw_networkx_nodes(self.GraphSet, pos, nodelist=list(community), node_color=[colors(i)], label=f'Community {i}')
+                else:
+                    node_sizes = [node_attr[node] * 100 for node in community]
+                    nx.draw_networkx_nodes(self.GraphSet, pos, nodelist=list(community), node_color=[colors(i)], node_size=node_sizes, label=f'Community {i}')
+            nx.draw_networkx_edges(self.GraphSet, pos)
+            nx.draw_networkx_labels(self.GraphSet, pos)
+
+        if not large or len(self.best_communities) <= 10:
+            plt.legend()
         if save_path:
             plt.savefig(save_path)
             print(f"Visualization saved as {save_path}")
@@ -301,13 +817,30 @@ class cgnlib:
         else:
             plt.show()  # Only show the plot if not saving
 
-    def visualize_with_node_attributes(self, attribute='degree', save_path=None):
+    def visualize_best_communities(self, save_path=None, layout=None, large=None):
+        """
+        Draws the best communities.
+
+        Args:
+            layout (str): 'spring', 'grid' or 'community'; see ``cgnlib.drawing.compute_layout``.
+                Defaults to 'grid' in large-graph mode and 'spring' otherwise.
+            large (bool): Large-graph mode: sampled, rasterized edges and no labels.
+                Defaults to True above ``LARGE_GRAPH_NODES`` nodes.
+        """
         if self.best_communities is None:
             print("No communities detected. Please run the detect_gn method first.")
             return
 
-        pos = nx.spring_layout(self.GraphSet)
-        colors = plt.get_cmap('tab10')
+        self._draw_communities(save_path, layout, large)
+
+    def visualize_with_node_attributes(self, attribute='degree', save_path=None, layout=None, large=None):
+        """
+        Draws the best communities with node sizes proportional to a node attribute.
+        ``layout`` and ``large`` are as in ``visualize_best_communities``.
+        """
+        if self.best_communities is None:
+            print("No communities detected. Please run the detect_gn method first.")
+            return
 
         if attribute == 'degree':
             node_attr = dict(self.GraphSet.degree())
@@ -317,19 +850,7 @@ class cgnlib:
         else:
             raise ValueError(f"Unsupported attribute: {attribute}")
 
-        for i, community in enumerate(self.best_communities):
-            node_sizes = [node_attr[node] * 100 for node in community]
-            nx.draw_networkx_nodes(self.GraphSet, pos, nodelist=list(community), node_color=[colors(i)], node_size=node_sizes, label=f'Community {i}')
-        nx.draw_networkx_edges(self.GraphSet, pos)
-        nx.draw_networkx_labels(self.GraphSet, pos)
-
-        plt.legend()
-        if save_path:
-            plt.savefig(save_path)
-            print(f"Visualization saved as {save_path}")
-            plt.close()  # Close the plot to prevent it from displaying
-        else:
-            plt.show()  # Only show the plot if not saving
+        self._draw_communities(save_path, layout, large, node_attr)
 
     def save_communities_to_csv(self, filename='community_results.csv'):
         if self.best_communities is None:
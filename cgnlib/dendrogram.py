@@ -0,0 +1,124 @@
+from array import array
+
+import numpy as np
+
+
+class Dendrogram:
+    """
+    Compact record of the splits made during a divisive community detection run.
+
+    Removed edges and split events are appended to flat typed arrays, so
+    recording costs O(1) per event. A split creates a new component id as
+    a child of the component it was cut from. Any level of the hierarchy
+    can later be extracted in O(V) by mapping the final component of each
+    node back to its ancestor at that level.
+
+    Level 0 is the partition the run started from (the connected components
+    of the input graph); level L is the partition after the first L splits.
+    """
+
+    def __init__(self, nodes, membership, modularity):
+        """
+        Args:
+            nodes (list): Nodes of the graph, in the order used for all arrays.
+            membership (dict): Initial component id of every node. Ids must be 0..c-1.
+            modularity (float): Modularity of the initial partition.
+        """
+        self.nodes = list(nodes)
+        self.node_index = {node: i for i, node in enumerate(self.nodes)}
+        self.initial_components = len(set(membership.values()))
+
+        self.removed_u = array('l')
+        self.removed_v = array('l')
+        self.removed_iteration = array('l')
+
+        self.split_iteration = array('l')
+        self.split_parent = array('l')
+        self.split_child = array('l')
+        self.split_modularity = array('d', [modularity])
+
+        self.final_labels = np.array([membership[node] for node in self.nodes], dtype=np.int64)
+
+    def __len__(self):
+        return len(self.split_iteration)
+
+    def record_removal(self, iteration, u, v):
+        self.removed_u.append(self.node_index[u])
+        self.removed_v.append(self.node_index[v])
+        self.removed_iteration.append(iteration)
+
+    def record_split(self, iteration, parent, child, modularity):
+        """
+        Records that component ``child`` was cut out of ``parent``, leaving the given modularity.
+        """
+        self.split_iteration.append(iteration)
+        self.split_parent.append(parent)
+        self.split_child.append(child)
+        self.split_modularity.append(modularity)
+
+    def finish(self, membership):
+        """
+        Stores the component id of every node at the end of the run.
+        """
+        self.final_labels = np.array([membership[node] for node in self.nodes], dtype=np.int64)
+
+    @property
+    def modularity(self):
+        """
+        Modularity of every level, from level 0 to ``len(self)``.
+        """
+        return np.frombuffer(self.split_modularity, dtype=float)
+
+    def removed_edges(self, iteration=None):
+        """
+        Returns the removed edges in removal order, optionally only those of one iteration.
+        """
+        edges = zip(self.removed_iteration, self.removed_u, self.removed_v)
+        return [(self.nodes[u], self.nodes[v]) for it, u, v in edges if iteration is None or it == iteration]
+
+    def best_level(self):
+        """
+        Returns the level with the highest modularity; ties go to the deepest level.
+        """
+        values = self.modularity
+        return int(len(values) - 1 - np.argmax(values[::-1]))
+
+    def level_for(self, num_communities):
+        """
+        Returns the first level with at least ``num_communities`` communities,
+        or the deepest recorded level if the run never got there.
+        """
+        return int(min(max(num_communities - self.initial_components, 0), len(self)))
+
+    def labels(self, level):
+        """
+        Returns the component id of every node at the given level, in ``self.nodes`` order.
+        """
+        if not 0 <= level <= len(self):
+            raise ValueError(f"Level must be between 0 and {len(self)}, got {level}")
+
+        num_ids = self.initial_components + len(self)
+        children = np.asarray(self.split_child, dtype=np.int64)
+        parent = np.arange(num_ids, dtype=np.int64)
+        parent[children] = np.asarray(self.split_parent, dtype=np.int64)
+
+        # Ids are created in split order, so every parent is resolved before its children
+        resolved = np.arange(num_ids, dtype=np.int64)
+        for cid in children[level:].tolist():
+            resolved[cid] = resolved[parent[cid]]
+        return resolved[self.final_labels]
+
+    def cut(self, level):
+        """
+        Returns the partition at the given level as a list of node sets,
+        in ``nx.connected_components`` order.
+        """
+        labels = self.labels(level)
+        _, first, inverse = np.unique(labels, return_index=True, return_inverse=True)
+        rank = np.empty(len(first), dtype=np.int64)
+        rank[np.argsort(first)] = np.arange(len(first))
+
+        communities = [set() for _ in range(len(first))]
+        for node, group in zip(self.nodes, rank[inverse].tolist()):
+            communities[group].add(node)
+        return communities
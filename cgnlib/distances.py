@@ -0,0 +1,118 @@
+import numpy as np
+
+from cgnlib.workers import pool_map
+
+# Sources expanded together by one sparse matrix product; bounds the
+# (nodes x batch) frontier matrices kept in memory
+BFS_BATCH_SIZE = 256
+
+# Below this many nodes a process pool costs more than it saves
+PARALLEL_MIN_NODES = 2048
+
+
+def _neighbor_lists(A):
+    indptr = A.indptr.tolist()
+    indices = A.indices.tolist()
+    return [indices[start:end] for start, end in zip(indptr, indptr[1:])]
+
+
+def _bfs_distance_sums(neighbors, sources):
+    """
+    Level-synchronous BFS from each source, keeping only the visited marks of the current one.
+    """
+    n = len(neighbors)
+    totals = []
+    for source in sources:
+        visited = bytearray(n)
+        visited[source] = 1
+        frontier = [source]
+        level = 0
+        total = 0
+        while frontier:
+            level += 1
+            reached = []
+            for v in frontier:
+                for w in neighbors[v]:
+                    if not visited[w]:
+                        visited[w] = 1
+                        reached.append(w)
+            total += level * len(reached)
+            frontier = reached
+        totals.append(total)
+    return np.array(totals, dtype=np.int64)
+
+
+def _sparse_distance_sums(A, sources):
+    """
+    BFS from a batch of sources at once: each level is one product of the
+    adjacency matrix with the (nodes x batch) frontier matrix.
+    """
+    n = A.shape[0]
+    columns = np.arange(len(sources))
+    visited = np.zeros((n, len(sources)), dtype=bool)
+    visited[sources, columns] = True
+    frontier = visited.astype(np.float32)
+    totals = np.zeros(len(sources), dtype=np.int64)
+    level = 0
+    while True:
+        level += 1
+        reached = (A @ frontier) != 0
+        reached &= ~visited
+        counts = reached.sum(axis=0)
+        if not counts.any():
+            return totals
+        totals += level * counts
+        visited |= reached
+        frontier = reached.astype(np.float32)
+
+
+def _chunk_distance_sums(A, neighbors, sources, sparse):
+    if sparse:
+        return _sparse_distance_sums(A, sources)
+    return _bfs_distance_sums(neighbors, sources)
+
+
+def _worker_setup(payload):
+    A, sparse = payload
+    return A, None if sparse else _neighbor_lists(A), sparse
+
+
+def _worker_distance_sums(state, sources):
+    A, neighbors, sparse = state
+    return _chunk_distance_sums(A, neighbors, sources, sparse)
+
+
+def distance_sums(A, workers=None, sparse=False, batch_size=BFS_BATCH_SIZE, pool=None):
+    """
+    Computes, for every node, the sum of shortest path lengths to the nodes it can reach.
+
+    Each BFS is summed as it runs, so only O(n) state per source (O(n x
+    batch_size) with ``sparse``) is held instead of all-pairs distances.
+    Sources are processed in batches of ``batch_size``; with ``workers`` > 1
+    or a ``pool``, and at least ``PARALLEL_MIN_NODES`` nodes, the batches are
+    spread over worker processes, which build their neighbour lists once per call.
+
+    Args:
+        A (scipy.sparse.csr_array): Symmetric adjacency matrix; values are ignored.
+        workers (int): Number of worker processes. Runs serially if None or 1.
+        sparse (bool): If True, run each batch as sparse matrix products
+            instead of one Python BFS per source.
+        batch_size (int): Number of sources per batch.
+        pool (cgnlib.workers.WorkerPool): Pool to reuse instead of starting one.
+
+    Returns:
+        numpy.ndarray: Distance sum of every node, in row order.
+    """
+    n = A.shape[0]
+    if sparse:
+        A = A.astype(np.float32)
+    batches = [np.arange(start, min(start + batch_size, n)) for start in range(0, n, batch_size)]
+    if not batches:
+        return np.zeros(0, dtype=np.int64)
+
+    workers = pool.workers if pool is not None else workers
+    if not workers or workers <= 1 or n < PARALLEL_MIN_NODES:
+        neighbors = None if sparse else _neighbor_lists(A)
+        return np.concatenate([_chunk_distance_sums(A, neighbors, sources, sparse) for sources in batches])
+
+    return np.concatenate(pool_map(_worker_distance_sums, batches, (A, sparse), _worker_setup, workers, pool))
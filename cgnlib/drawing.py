@@ -0,0 +1,111 @@
+import math
+import random
+
+import igraph as ig
+import matplotlib.pyplot as plt
+import networkx as nx
+import numpy as np
+from matplotlib.collections import LineCollection
+
+LAYOUTS = ('spring', 'grid', 'community')
+
+# Force iterations of the grid layout
+GRID_LAYOUT_ITERATIONS = 100
+
+# Graphs with more nodes than this are drawn in large-graph mode by default
+LARGE_GRAPH_NODES = 2000
+
+# Edges drawn at most in large-graph mode; the rest are sampled away
+MAX_DRAWN_EDGES = 50000
+
+
+def _grid_layout(G, seed=None):
+    # igraph's Fruchterman-Reingold in C with repulsion only between nearby
+    # nodes on a grid, which is about 3 s for 100k nodes
+    index = {node: i for i, node in enumerate(G)}
+    graph = ig.Graph(n=len(index), edges=[(index[u], index[v]) for u, v in G.edges()])
+    start = None if seed is None else np.random.default_rng(seed).random((len(index), 2)).tolist()
+    coords = graph.layout_fruchterman_reingold(seed=start, niter=GRID_LAYOUT_ITERATIONS, grid=True).coords
+    return {node: np.asarray(coords[i]) for node, i in index.items()}
+
+
+def _community_layout(G, communities, seed=None):
+    """
+    Places each community with a spring layout of the community supergraph,
+    then spreads its nodes around that point with a local layout scaled by
+    the square root of its size. Cost is dominated by the largest community.
+    """
+    community_of = {node: i for i, community in enumerate(communities) for node in community}
+    supergraph = nx.Graph()
+    supergraph.add_nodes_from(range(len(communities)))
+    for u, v in G.edges():
+        cu, cv = community_of[u], community_of[v]
+        if cu != cv:
+            weight = supergraph.get_edge_data(cu, cv, {'weight': 0})['weight']
+            supergraph.add_edge(cu, cv, weight=weight + 1)
+    centers = nx.spring_layout(supergraph, weight='weight', seed=seed)
+
+    scale = 1 / math.sqrt(max(len(communities), 1))
+    pos = {}
+    for i, community in enumerate(communities):
+        subgraph = G.subgraph(community)
+        if len(community) > LARGE_GRAPH_NODES:
+            local = _grid_layout(subgraph, seed)
+            local = nx.rescale_layout_dict(local)
+        else:
+            local = nx.spring_layout(subgraph, seed=seed)
+        radius = scale * math.sqrt(len(community) / max(len(G), 1))
+        for node, xy in local.items():
+            pos[node] = centers[i] + radius * np.asarray(xy)
+    return pos
+
+
+def compute_layout(G, method='spring', communities=None, seed=None):
+    """
+    Computes node positions for drawing.
+
+    Args:
+        method (str): 'spring' (NetworkX Fruchterman-Reingold), 'grid' (igraph's
+            grid-approximated Fruchterman-Reingold, for large graphs) or
+            'community' (communities placed by a supergraph layout and laid out
+            separately; needs ``communities``).
+        seed (int): Seed for reproducible layouts.
+    """
+    if method == 'spring':
+        return nx.spring_layout(G, seed=seed)
+    if method == 'grid':
+        return _grid_layout(G, seed)
+    if method == 'community':
+        if communities is None:
+            raise ValueError("The community layout needs communities.")
+        return _community_layout(G, communities, seed)
+    raise ValueError(f"Unsupported layout: {method}. Choose one of {LAYOUTS}.")
+
+
+def draw_large_graph(G, pos, communities, node_sizes=None, max_edges=MAX_DRAWN_EDGES, seed=0, ax=None):
+    """
+    Draws a graph with one rasterized ``LineCollection`` for the edges and one
+    rasterized scatter for the nodes, without labels. At most ``max_edges``
+    uniformly sampled edges are drawn.
+
+    Args:
+        node_sizes (dict): Marker size per node; a small constant size if None.
+    """
+    if ax is None:
+        ax = plt.gca()
+    colors = plt.get_cmap('tab10')
+
+    edges = list(G.edges())
+    if len(edges) > max_edges:
+        edges = random.Random(seed).sample(edges, max_edges)
+    segments = np.array([(pos[u], pos[v]) for u, v in edges]).reshape(-1, 2, 2)
+    ax.add_collection(LineCollection(segments, colors='0.6', linewidths=0.2, alpha=0.5, rasterized=True))
+
+    for i, community in enumerate(communities):
+        nodes = list(community)
+        xy = np.array([pos[node] for node in nodes]).reshape(-1, 2)
+        sizes = 1 if node_sizes is None else [node_sizes[node] for node in nodes]
+        ax.scatter(xy[:, 0], xy[:, 1], s=sizes, color=[colors(i)], linewidths=0, rasterized=True,
+                   label=f'Community {i}' if len(communities) <= 10 else None)
+    ax.autoscale_view()
+    ax.set_axis_off()
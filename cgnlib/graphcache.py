@@ -0,0 +1,195 @@
+import hashlib
+import os
+import struct
+import zipfile
+
+import numpy as np
+
+from cgnlib.graphcore import GraphCore
+from cgnlib.loader import EdgeList, load_edge_list
+
+# Binary caches are written next to the source file with this suffix
+CACHE_SUFFIX = '.cgn.npz'
+
+# Bump whenever the layout of the cached arrays changes
+CACHE_VERSION = 2
+
+# GraphCore arrays stored in the cache as 'core_<name>'
+CORE_ARRAYS = ('src', 'dst', 'indptr', 'indices', 'entry_edge')
+
+
+def cache_path(path):
+    return path + CACHE_SUFFIX
+
+
+def file_digest(path, chunk_size=1 << 20):
+    """
+    Returns the SHA-1 digest of a file's contents.
+    """
+    digest = hashlib.sha1()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _write_meta(target, stat):
+    # The version, mtime and size of the source live in the zip comment, which
+    # can be rewritten without touching (or invalidating maps of) the arrays
+    with zipfile.ZipFile(target, 'a') as archive:
+        archive.comment = f"cgn {CACHE_VERSION} {stat.st_mtime_ns} {stat.st_size}".encode('ascii')
+
+
+def _read_meta(comment):
+    parts = comment.decode('ascii', 'replace').split()
+    if len(parts) != 4 or parts[0] != 'cgn':
+        return None
+    return tuple(int(part) for part in parts[1:])
+
+
+def write_cache(path, edge_list, core, digest=None):
+    """
+    Writes ``edge_list`` and its ``GraphCore`` as an uncompressed ``.npz`` next to ``path``.
+
+    Every array, including the label table (one newline-separated UTF-8 blob),
+    is stored uncompressed so that :func:`read_cache` can memory-map it, and
+    the core's deduplicated edges and CSR arrays are stored as built, so a
+    cached load does no graph construction at all. The source file's SHA-1
+    digest is stored alongside, and its mtime and size in the zip comment.
+    The file is written to a temporary name and moved into place, so
+    concurrent readers never see a partial cache.
+    """
+    stat = os.stat(path)
+    if digest is None:
+        digest = file_digest(path)
+
+    # Labels come from whitespace-separated fields, so they never contain a newline
+    arrays = {
+        'digest': np.frombuffer(digest, dtype=np.uint8),
+        'labels': np.frombuffer('\n'.join(edge_list.labels).encode('utf-8'), dtype=np.uint8),
+        'label_count': np.array([len(edge_list.labels)], dtype=np.int64),
+        'src': edge_list.src,
+        'dst': edge_list.dst,
+    }
+    if edge_list.weights is not None:
+        arrays['weights'] = edge_list.weights
+    for name in CORE_ARRAYS:
+        arrays[f'core_{name}'] = getattr(core, name)
+    if core.weights is not None:
+        arrays['core_weights'] = core.weights
+
+    target = cache_path(path)
+    temporary = f"{target}.{os.getpid()}.tmp"
+    with open(temporary, 'wb') as file:
+        np.savez(file, **arrays)
+    _write_meta(temporary, stat)
+    os.replace(temporary, target)
+
+
+def _mmap_member(path, info):
+    with open(path, 'rb') as file:
+        file.seek(info.header_offset)
+        local_header = file.read(30)
+        name_length, extra_length = struct.unpack('<HH', local_header[26:30])
+        file.seek(info.header_offset + 30 + name_length + extra_length)
+        if np.lib.format.read_magic(file) == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+        offset = file.tell()
+    if int(np.prod(shape)) == 0:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=shape,
+                     order='F' if fortran_order else 'C')
+
+
+def read_cache(path):
+    """
+    Opens a cache written by :func:`write_cache` and memory-maps all its arrays read-only.
+
+    Returns:
+        tuple: Array name to read-only ``numpy.memmap``, and the
+        (version, mtime_ns, size) stored in the zip comment, or None.
+    """
+    arrays = {}
+    with zipfile.ZipFile(path) as archive:
+        meta = _read_meta(archive.comment)
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{path}: member {info.filename} is compressed and cannot be memory-mapped.")
+            arrays[info.filename[:-len('.npy')]] = _mmap_member(path, info)
+    return arrays, meta
+
+
+def _is_current(arrays, meta, path, target):
+    if meta is None or meta[0] != CACHE_VERSION:
+        return False
+    _, mtime_ns, size = meta
+    stat = os.stat(path)
+    if stat.st_mtime_ns == mtime_ns and stat.st_size == size:
+        return True
+    # Touched but possibly unchanged: fall back to comparing contents, and
+    # record the new mtime so later loads do not hash the file again
+    if bytes(arrays['digest']) != file_digest(path):
+        return False
+    try:
+        _write_meta(target, stat)
+    except OSError:
+        pass
+    return True
+
+
+def _graph_from_cache(arrays):
+    labels = bytes(arrays['labels']).decode('utf-8').split('\n') if int(arrays['label_count'][0]) else []
+    edge_list = EdgeList(labels, arrays['src'], arrays['dst'], arrays.get('weights'))
+    core = GraphCore(labels, *(arrays[f'core_{name}'] for name in ('indptr', 'indices', 'entry_edge', 'src', 'dst')),
+                     arrays.get('core_weights'))
+    return edge_list, core
+
+
+def load_cached_graph(path, cache=True):
+    """
+    Loads an edge list and its ``GraphCore``, going through a memory-mapped
+    binary cache next to the file.
+
+    A cache is reused when the source's mtime and size match, or, failing
+    that, when its SHA-1 digest still matches. Otherwise the text file is
+    parsed and the cache is rewritten. If the directory is read-only the
+    cache is silently skipped. A cached core reads its arrays straight from
+    the read-only maps, so processes loading the same file share them.
+
+    Args:
+        path (str): Edge-list file, as accepted by :func:`load_edge_list`.
+        cache (bool): If False, always parse the text file and write nothing.
+
+    Returns:
+        tuple: (EdgeList, GraphCore).
+    """
+    if not cache:
+        edge_list = load_edge_list(path)
+        return edge_list, GraphCore.from_edge_list(edge_list)
+
+    target = cache_path(path)
+    if os.path.exists(target):
+        try:
+            arrays, meta = read_cache(target)
+            if _is_current(arrays, meta, path, target):
+                return _graph_from_cache(arrays)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            pass  # Unreadable or stale cache: rebuild it below
+
+    digest = file_digest(path)
+    edge_list = load_edge_list(path)
+    core = GraphCore.from_edge_list(edge_list)
+    try:
+        write_cache(path, edge_list, core, digest)
+    except OSError:
+        pass
+    return edge_list, core
+
+
+def load_cached_edge_list(path, cache=True):
+    """
+    Loads an edge list through the cache of :func:`load_cached_graph`.
+    """
+    return load_cached_graph(path, cache)[0]
@@ -0,0 +1,232 @@
+import networkx as nx
+import numpy as np
+
+# Edge data handed out for unweighted edges; ``data.get('weight', 1)`` reads 1
+_NO_DATA = {}
+
+
+class GraphCore:
+    """
+    Compact undirected graph over int32 node ids, with a NetworkX-like read API.
+
+    Node labels are interned to ids 0..n-1 in NetworkX node order. Every
+    distinct edge has an id and is stored once in ``src``/``dst`` (``src <= dst``);
+    the CSR arrays ``indptr``/``indices``/``entry_edge`` list each node's
+    neighbours and incident edge ids in NetworkX adjacency order. Removals only
+    clear the edge in the ``alive`` mask, which is shared between copies until
+    one of them removes an edge, so ``copy()`` is O(1).
+
+    Iterating nodes, ``edges()`` and ``G[node]`` yield labels in exactly the
+    order the equivalent ``nx.Graph`` would, so algorithms written against
+    NetworkX graphs produce identical results on either.
+    """
+
+    def __init__(self, labels, indptr, indices, entry_edge, src, dst, weights=None):
+        self.labels = labels
+        self._index = [None]  # Label to id, built on first use and shared by all copies
+        self.indptr = indptr
+        self.indices = indices
+        self.entry_edge = entry_edge
+        self.src = src
+        self.dst = dst
+        self.weights = weights
+        self.alive = np.ones(len(src), dtype=bool)
+        self._alive_shared = False
+        self._num_edges = len(src)
+        self._base_digest = [None]  # Digest of the arrays above, shared by all copies; see cgnlib.memo
+
+    @property
+    def index(self):
+        """
+        Maps every node label to its id.
+        """
+        if self._index[0] is None:
+            self._index[0] = {label: i for i, label in enumerate(self.labels)}
+        return self._index[0]
+
+    @classmethod
+    def _from_edges(cls, labels, src, dst, weights=None):
+        # Edge ids must already be in insertion order, which is also the adjacency order of both endpoints
+        n = len(labels)
+        edge_ids = np.arange(len(src), dtype=np.int32)
+        not_loop = src != dst
+        rows = np.concatenate([src, dst[not_loop]])
+        cols = np.concatenate([dst, src[not_loop]])
+        entry_edge = np.concatenate([edge_ids, edge_ids[not_loop]])
+        order = np.lexsort((entry_edge, rows))
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+        return cls(labels, indptr, cols[order].astype(np.int32), entry_edge[order], src, dst, weights)
+
+    @classmethod
+    def from_edge_list(cls, edge_list):
+        """
+        Builds the graph of an ``EdgeList`` without going through NetworkX.
+
+        Repeated edges keep the position of their first line and the weight of
+        their last, as adding the lines to an ``nx.Graph`` one by one would.
+        """
+        n = edge_list.number_of_nodes
+        lo = np.minimum(edge_list.src, edge_list.dst).astype(np.int32)
+        hi = np.maximum(edge_list.src, edge_list.dst).astype(np.int32)
+        keys = lo.astype(np.int64) * n + hi
+        _, first = np.unique(keys, return_index=True)
+        first = np.sort(first)
+        weights = None
+        if edge_list.weights is not None:
+            _, last_reversed, inverse = np.unique(keys[::-1], return_index=True, return_inverse=True)
+            last = len(keys) - 1 - last_reversed
+            weights = np.asarray(edge_list.weights)[last[inverse[::-1][first]]]
+        return cls._from_edges(list(edge_list.labels), lo[first], hi[first], weights)
+
+    @classmethod
+    def from_networkx(cls, G):
+        """
+        Builds the graph of an ``nx.Graph``, keeping its node and adjacency order.
+        """
+        labels = list(G)
+        index = {label: i for i, label in enumerate(labels)}
+        edges = list(G.edges(data='weight'))
+        src = np.fromiter((index[u] for u, _, _ in edges), dtype=np.int32, count=len(edges))
+        dst = np.fromiter((index[v] for _, v, _ in edges), dtype=np.int32, count=len(edges))
+        weights = None
+        if any(w is not None for _, _, w in edges):
+            weights = np.array([1 if w is None else w for _, _, w in edges], dtype=float)
+
+        edge_id = {}
+        for i, (u, v, _) in enumerate(edges):
+            edge_id[u, v] = edge_id[v, u] = i
+        indptr = np.zeros(len(labels) + 1, dtype=np.int64)
+        np.cumsum([len(G[label]) for label in labels], out=indptr[1:])
+        indices = np.fromiter((index[nbr] for label in labels for nbr in G[label]), dtype=np.int32, count=indptr[-1])
+        entry_edge = np.fromiter((edge_id[label, nbr] for label in labels for nbr in G[label]), dtype=np.int32,
+                                 count=indptr[-1])
+        core = cls(labels, indptr, indices, entry_edge, src, dst, weights)
+        core._index[0] = index
+        return core
+
+    def copy(self):
+        """
+        Returns an independent copy in O(1); the alive mask is copied on the first removal.
+        """
+        other = object.__new__(GraphCore)
+        other.__dict__.update(self.__dict__)
+        self._alive_shared = other._alive_shared = True
+        return other
+
+    def __iter__(self):
+        return iter(self.labels)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, label):
+        return label in self.index
+
+    def __getitem__(self, label):
+        """
+        Returns the live neighbours of a node as a dict of neighbour label to edge data.
+        """
+        i = self.index[label]
+        start, end = self.indptr[i], self.indptr[i + 1]
+        live = self.alive[self.entry_edge[start:end]]
+        nbrs = self.indices[start:end][live].tolist()
+        if self.weights is None:
+            return {self.labels[j]: _NO_DATA for j in nbrs}
+        weights = self.weights[self.entry_edge[start:end][live]].tolist()
+        return {self.labels[j]: {'weight': w} for j, w in zip(nbrs, weights)}
+
+    def number_of_nodes(self):
+        return len(self.labels)
+
+    def number_of_edges(self):
+        return self._num_edges
+
+    def has_edge(self, u, v):
+        return self._edge_id(u, v) is not None
+
+    def _edge_id(self, u, v):
+        i, j = self.index.get(u), self.index.get(v)
+        if i is None or j is None:
+            return None
+        start, end = self.indptr[i], self.indptr[i + 1]
+        for entry in np.flatnonzero(self.indices[start:end] == j).tolist():
+            edge = int(self.entry_edge[start + entry])
+            if self.alive[edge]:
+                return edge
+        return None
+
+    def remove_edge(self, u, v):
+        edge = self._edge_id(u, v)
+        if edge is None:
+            raise nx.NetworkXError(f"The edge {u}-{v} is not in the graph")
+        if self._alive_shared:
+            self.alive = self.alive.copy()
+            self._alive_shared = False
+        self.alive[edge] = False
+        self._num_edges -= 1
+
+    def edge_entries(self):
+        """
+        Returns (src, dst, edge ids) of the live edges as arrays, in ``edges()`` order and orientation.
+        """
+        rows = np.repeat(np.arange(len(self.labels), dtype=np.int32), np.diff(self.indptr))
+        keep = self.alive[self.entry_edge] & (self.indices >= rows)
+        return rows[keep], self.indices[keep], self.entry_edge[keep]
+
+    def edges(self, nbunch=None):
+        """
+        Returns the live edges as label pairs, in ``nx.Graph.edges`` order and orientation.
+        """
+        labels = self.labels
+        if nbunch is None:
+            src, dst, _ = self.edge_entries()
+            return [(labels[u], labels[v]) for u, v in zip(src.tolist(), dst.tolist())]
+
+        edges = []
+        seen = set()
+        for label in nbunch:
+            if label not in self.index:
+                continue
+            for nbr in self[label]:
+                if nbr not in seen:
+                    edges.append((label, nbr))
+            seen.add(label)
+        return edges
+
+    def degree(self, weight=None):
+        """
+        Returns (label, degree) pairs of the live graph; a self-loop counts twice.
+        """
+        n = len(self.labels)
+        src, dst = self.src[self.alive], self.dst[self.alive]
+        if weight is None or self.weights is None:
+            degree = np.bincount(src, minlength=n) + np.bincount(dst, minlength=n)
+        else:
+            w = self.weights[self.alive]
+            degree = np.bincount(src, weights=w, minlength=n) + np.bincount(dst, weights=w, minlength=n)
+        return list(zip(self.labels, degree.tolist()))
+
+    def edge_arrays(self):
+        """
+        Returns (labels, src, dst, weights) of the live edges, as read by
+        ``cgnlib.quality.partition_quality``. Missing weights are 1.
+        """
+        weights = np.ones(self._num_edges) if self.weights is None else self.weights[self.alive]
+        return self.labels, self.src[self.alive], self.dst[self.alive], weights
+
+    def to_networkx(self):
+        """
+        Returns the live graph as an ``nx.Graph`` with the original labels,
+        with the same node and adjacency order. Weights become the ``weight`` attribute.
+        """
+        G = nx.Graph()
+        G.add_nodes_from(self.labels)
+        edges = np.flatnonzero(self.alive)
+        src = [self.labels[i] for i in self.src[edges].tolist()]
+        dst = [self.labels[i] for i in self.dst[edges].tolist()]
+        if self.weights is None:
+            G.add_edges_from(zip(src, dst))
+        else:
+            G.add_weighted_edges_from(zip(src, dst, self.weights[edges].tolist()))
+        return G
@@ -0,0 +1,162 @@
+import networkx as nx
+import numpy as np
+
+
+class LineGraph:
+    """
+    Array-backed line graph (edge-adjacency graph) of an undirected graph.
+
+    Every edge of the source graph becomes a vertex, and two vertices are
+    adjacent when their edges share an endpoint. The adjacency is stored in
+    CSR form (``indptr``/``indices``) with each row sorted, and is built from
+    per-node incidence lists, so construction costs O(sum(deg(v)^2)) instead
+    of comparing every pair of edges. Removed edges are tracked with an alive
+    mask, so one structure can follow a graph through a whole Girvan-Newman run.
+    """
+
+    def __init__(self, edges):
+        """
+        Builds the line graph of the given edge list.
+
+        Args:
+            edges (iterable of tuple): Edges of the source graph, in the order
+                that defines the vertex indices of the line graph.
+        """
+        self.edges = [tuple(edge) for edge in edges]
+        self.edge_index = {edge: i for i, edge in enumerate(self.edges)}
+        self.indptr, self.indices = self._build_csr(self.edges)
+        self.alive = np.ones(len(self.edges), dtype=bool)
+        self.degree = np.diff(self.indptr)
+        self._rows = np.repeat(np.arange(len(self.edges), dtype=np.int64), self.degree)
+
+    @classmethod
+    def from_graph(cls, G):
+        """
+        Builds the line graph of a NetworkX graph, indexing edges in ``G.edges()`` order.
+        """
+        return cls(G.edges())
+
+    @staticmethod
+    def _build_csr(edges):
+        m = len(edges)
+        if m == 0:
+            return np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        node_ids = {}
+        endpoints = np.array([[node_ids.setdefault(u, len(node_ids)), node_ids.setdefault(v, len(node_ids))]
+                              for u, v in edges], dtype=np.int64)
+        edge_ids = np.arange(m, dtype=np.int64)
+
+        # Incidence lists: one (node, edge) entry per endpoint, self-loops counted once
+        not_loop = endpoints[:, 0] != endpoints[:, 1]
+        inc_node = np.concatenate([endpoints[:, 0], endpoints[not_loop, 1]])
+        inc_edge = np.concatenate([edge_ids, edge_ids[not_loop]])
+        order = np.lexsort((inc_edge, inc_node))
+        inc_node = inc_node[order]
+        inc_edge = inc_edge[order]
+
+        # Every ordered pair of distinct edges within one incidence list is a line-graph edge
+        block_size = np.bincount(inc_node)[inc_node]
+        block_start = np.concatenate([[0], np.cumsum(np.bincount(inc_node))[:-1]])[inc_node]
+        rows = np.repeat(inc_edge, block_size)
+        entry_start = np.repeat(np.cumsum(block_size) - block_size, block_size)
+        offsets = np.arange(rows.size, dtype=np.int64) - entry_start
+        cols = inc_edge[np.repeat(block_start, block_size) + offsets]
+
+        keep = rows != cols
+        rows = rows[keep]
+        cols = cols[keep]
+        order = np.lexsort((cols, rows))
+        indices = cols[order]
+        indptr = np.zeros(m + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=m), out=indptr[1:])
+        return indptr, indices
+
+    def __len__(self):
+        return int(self.alive.sum())
+
+    def neighbors(self, i):
+        """
+        Returns the live line-graph neighbours of vertex ``i`` as a sorted index array.
+        """
+        nbrs = self.indices[self.indptr[i]:self.indptr[i + 1]]
+        return nbrs[self.alive[nbrs]]
+
+    def index_of(self, edge):
+        """
+        Returns the vertex index of a source edge given in either orientation, or None.
+        """
+        i = self.edge_index.get(tuple(edge))
+        if i is None:
+            i = self.edge_index.get(tuple(reversed(edge)))
+        return i
+
+    def remove_edges(self, edges):
+        """
+        Deletes the vertices of the given source edges from the line graph.
+
+        Each deletion clears the vertex in the alive mask and decrements the
+        live degree of its neighbours, so it costs O(degree) and the CSR arrays
+        are never rebuilt. Edges may be given in either orientation; edges that
+        are unknown or already removed are ignored.
+        """
+        for edge in edges:
+            i = self.index_of(edge)
+            if i is None or not self.alive[i]:
+                continue
+            self.alive[i] = False
+            self.degree[self.neighbors(i)] -= 1
+            self.degree[i] = 0
+
+    def alive_edges(self):
+        """
+        Returns the source edges that are still present, in index order.
+        """
+        return [self.edges[i] for i in np.flatnonzero(self.alive).tolist()]
+
+    def to_networkx(self, edges=None):
+        """
+        Returns the live part of the line graph as an ``nx.Graph`` labelled 1..m.
+
+        Live vertices are relabelled consecutively in index order, and nodes and
+        adjacencies are inserted in the same order as a pairwise construction
+        over ``G.edges()`` of the current graph would produce, so NetworkX and
+        netcenlib metrics return identical results.
+
+        Args:
+            edges (iterable of tuple): If given, only the induced subgraph on
+                these live source edges is returned. For a connected component
+                of the source graph its traversal order matches the full view.
+
+        Returns:
+            tuple: The line graph and a dict mapping each live source edge to its label.
+        """
+        m = len(self.edges)
+        if edges is None:
+            selected = self.alive
+        else:
+            selected = np.zeros(m, dtype=bool)
+            selected[[self.index_of(edge) for edge in edges]] = True
+            selected &= self.alive
+        live = np.flatnonzero(selected)
+        labels = np.cumsum(selected)
+        H = nx.Graph()
+
+        rows = self._rows
+        live_entry = np.flatnonzero(selected[rows] & selected[self.indices])
+
+        # A pairwise construction first meets vertex j either as the head of its
+        # own row or, earlier, inside the row of its smallest live neighbour r < j.
+        first = live.copy()
+        live_rows, first_entry = np.unique(rows[live_entry], return_index=True)
+        first[np.searchsorted(live, live_rows)] = self.indices[live_entry[first_entry]]
+        row_key = np.minimum(first, live)
+        keys = rows * m + self.indices
+        pos_key = np.where(row_key < live, np.searchsorted(keys, row_key * m + live), -1)
+        H.add_nodes_from(labels[live[np.lexsort((pos_key, row_key))]].tolist())
+
+        upper = live_entry[self.indices[live_entry] > rows[live_entry]]
+        H.add_edges_from(zip(labels[rows[upper]].tolist(), labels[self.indices[upper]].tolist()))
+
+        edge_to_node = {self.edges[i]: int(labels[i]) for i in live.tolist()}
+        return H, edge_to_node
@@ -0,0 +1,141 @@
+import bz2
+import gzip
+import io
+from array import array
+
+import networkx as nx
+import numpy as np
+from scipy.sparse import csr_array
+
+# Approximate number of bytes parsed per chunk
+CHUNK_SIZE = 1 << 20
+
+COMMENT_PREFIXES = ('#', '%')
+
+
+def _open_text(path):
+    """
+    Opens a plain, gzip or bz2 compressed text file, detected from its magic bytes.
+    """
+    with open(path, 'rb') as raw:
+        magic = raw.read(3)
+    if magic[:2] == b'\x1f\x8b':
+        return gzip.open(path, 'rt', encoding='utf-8')
+    if magic == b'BZh':
+        return bz2.open(path, 'rt', encoding='utf-8')
+    return io.open(path, 'r', encoding='utf-8')
+
+
+class EdgeList:
+    """
+    Undirected edge list with node labels interned to contiguous int32 ids.
+
+    ``src``/``dst`` hold one entry per edge line of the source file, in file
+    order, and ``labels[i]`` is the original label of node id ``i``. Ids are
+    assigned in order of first appearance, which is also the node order of
+    the NetworkX view.
+    """
+
+    def __init__(self, labels, src, dst, weights=None, adjacency=None):
+        self.labels = labels
+        self.src = src
+        self.dst = dst
+        self.weights = weights
+        self._adjacency = adjacency
+
+    @property
+    def number_of_nodes(self):
+        return len(self.labels)
+
+    def _unique_edges(self):
+        # Collapse repeated edges the way nx.Graph.add_edge does: the last weight wins
+        lo = np.minimum(self.src, self.dst).astype(np.int64)
+        hi = np.maximum(self.src, self.dst).astype(np.int64)
+        keys = lo * self.number_of_nodes + hi
+        _, last = np.unique(keys[::-1], return_index=True)
+        keep = np.sort(len(keys) - 1 - last)
+        weights = self.weights[keep] if self.weights is not None else np.ones(len(keep))
+        return lo[keep], hi[keep], weights
+
+    def csr(self):
+        """
+        Returns the symmetric adjacency matrix as a ``scipy.sparse.csr_array``.
+        Self-loops appear once on the diagonal.
+        """
+        if self._adjacency is not None:
+            return self._adjacency
+        lo, hi, weights = self._unique_edges()
+        off_diagonal = lo != hi
+        rows = np.concatenate([lo, hi[off_diagonal]])
+        cols = np.concatenate([hi, lo[off_diagonal]])
+        data = np.concatenate([weights, weights[off_diagonal]])
+        n = self.number_of_nodes
+        self._adjacency = csr_array((data, (rows, cols)), shape=(n, n))
+        return self._adjacency
+
+    def to_networkx(self):
+        """
+        Returns the graph as an ``nx.Graph`` with the original string labels.
+
+        Nodes and edges are inserted in file order, exactly as adding the
+        edges line by line would. A weight column becomes the ``weight`` edge attribute.
+        """
+        G = nx.Graph()
+        G.add_nodes_from(self.labels)
+        src = [self.labels[i] for i in self.src.tolist()]
+        dst = [self.labels[i] for i in self.dst.tolist()]
+        if self.weights is None:
+            G.add_edges_from(zip(src, dst))
+        else:
+            G.add_weighted_edges_from(zip(src, dst, self.weights.tolist()))
+        return G
+
+
+def load_edge_list(path, chunk_size=CHUNK_SIZE, comments=COMMENT_PREFIXES):
+    """
+    Streams a whitespace-separated edge list into an ``EdgeList``.
+
+    The file is read in chunks of about ``chunk_size`` bytes and may be gzip
+    or bz2 compressed. Blank lines and lines starting with one of ``comments``
+    are skipped. Every other line holds two node labels, optionally followed by
+    a numeric weight; edges without one get weight 1 if any line has one.
+
+    Raises:
+        ValueError: If a line does not hold two labels and an optional weight.
+    """
+    node_ids = {}
+    src = array('i')
+    dst = array('i')
+    weights = array('d')
+    weighted = False
+    line_number = 0
+
+    with _open_text(path) as file:
+        while True:
+            lines = file.readlines(chunk_size)
+            if not lines:
+                break
+            for line in lines:
+                line_number += 1
+                parts = line.split()
+                if not parts or parts[0].startswith(comments):
+                    continue
+                if len(parts) == 2:
+                    weights.append(1.0)
+                elif len(parts) == 3:
+                    try:
+                        weights.append(float(parts[2]))
+                    except ValueError:
+                        raise ValueError(f"Line {line_number}: invalid weight {parts[2]!r}.")
+                    weighted = True
+                else:
+                    raise ValueError(f"Line {line_number}: expected two nodes and an optional weight, got {len(parts)} fields.")
+                src.append(node_ids.setdefault(parts[0], len(node_ids)))
+                dst.append(node_ids.setdefault(parts[1], len(node_ids)))
+
+    return EdgeList(
+        list(node_ids),
+        np.frombuffer(src, dtype=np.int32),
+        np.frombuffer(dst, dtype=np.int32),
+        np.frombuffer(weights, dtype=np.float64) if weighted else None,
+    )
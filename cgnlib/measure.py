@@ -0,0 +1,120 @@
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+class PhaseTimer:
+    """
+    Accumulates wall-clock seconds per named phase.
+
+    Phases may be nested; time spent in an inner phase is only counted for
+    the inner phase, so the totals add up to the time spent inside any phase.
+    """
+
+    def __init__(self):
+        self.totals = {}
+        self._stack = []
+
+    def reset(self):
+        self.totals = {}
+        self._stack = []
+
+    @contextmanager
+    def phase(self, name):
+        now = time.perf_counter()
+        if self._stack:
+            parent, started = self._stack[-1]
+            self.totals[parent] = self.totals.get(parent, 0.0) + now - started
+        self._stack.append((name, now))
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            _, started = self._stack.pop()
+            self.totals[name] = self.totals.get(name, 0.0) + now - started
+            if self._stack:
+                self._stack[-1] = (self._stack[-1][0], now)
+
+
+def reset_peak_rss():
+    """
+    Resets the peak resident set size of the current process to its current
+    size, so ``peak_rss_mb`` reports the peak from now on. Only Linux allows
+    this (through ``/proc/self/clear_refs``); returns whether it worked.
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as file:
+            file.write('5')
+    except OSError:
+        return False
+    return True
+
+
+def peak_rss_mb():
+    """
+    Returns the peak resident set size of the current process in MB, since it
+    started or since the last ``reset_peak_rss``, or None if unknown.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+class Measurement:
+    """
+    Measures one experiment: wall-clock time, CPU time and peak RSS, plus the
+    tracemalloc peak when ``trace_memory`` is set. tracemalloc is off by
+    default because it slows allocation-heavy code severalfold.
+
+    The peak RSS is reset on entry where the platform allows it (Linux), so
+    'Peak RSS (MB)' is the peak of this run alone. Elsewhere only the
+    high-water mark of the whole process is known, which includes every
+    earlier run in it; it is reported as 'Process Peak RSS (MB)' instead.
+
+    Use as a context manager, then read the result columns from ``columns()``.
+    Subclasses can add columns by extending ``columns()``.
+    """
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.wall_time = None
+        self.cpu_time = None
+        self.peak_rss = None
+        self.peak_rss_per_run = False
+        self.peak_traced = None
+
+    def __enter__(self):
+        if self.trace_memory:
+            tracemalloc.start()
+        self.peak_rss_per_run = reset_peak_rss()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.wall_time = time.perf_counter() - self._wall_start
+        self.cpu_time = time.process_time() - self._cpu_start
+        if self.trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.peak_traced = peak / 1024 / 1024
+        self.peak_rss = peak_rss_mb()
+        return False
+
+    def columns(self):
+        peak_rss = None if self.peak_rss is None else round(self.peak_rss, 2)
+        return {
+            'Wall Time (s)': round(self.wall_time, 3),
+            'CPU Time (s)': round(self.cpu_time, 3),
+            'Peak RSS (MB)': peak_rss if self.peak_rss_per_run else None,
+            'Process Peak RSS (MB)': None if self.peak_rss_per_run else peak_rss,
+            'Peak Traced Memory (MB)': None if self.peak_traced is None else round(self.peak_traced, 2),
+        }
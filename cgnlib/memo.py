@@ -0,0 +1,185 @@
+import hashlib
+import os
+import re
+from collections import OrderedDict
+
+import numpy as np
+
+from cgnlib._version import __version__
+from cgnlib.graphcore import GraphCore
+
+# Default memory budget of a CentralityCache
+DEFAULT_MAX_BYTES = 256 << 20
+
+# Default disk budget of a CentralityCache with a directory
+DEFAULT_MAX_DISK_BYTES = 1 << 30
+
+# Disk entries are named <metric>-<fingerprint>-<version>.npy; see CentralityCache._path
+_ENTRY_NAME = re.compile(r'-[0-9a-f]{40}-.+(?<!\.tmp)\.npy$')
+
+
+def edge_set_fingerprint(G):
+    """
+    Returns a digest identifying the current edge set of a graph and the order of ``G.edges()``.
+
+    For a ``GraphCore`` this hashes the digest of its full edge arrays, which
+    copies share, and the packed alive mask, so it costs O(m / 8) per call.
+    Other graphs hash their edge list in ``G.edges()`` order.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    if isinstance(G, GraphCore):
+        if G._base_digest[0] is None:
+            base = hashlib.blake2b(digest_size=20)
+            for array in (G.indptr, G.indices, G.entry_edge, G.src, G.dst):
+                base.update(np.ascontiguousarray(array).tobytes())
+            if G.weights is not None:
+                base.update(np.ascontiguousarray(G.weights).tobytes())
+            G._base_digest[0] = base.digest()
+        digest.update(G._base_digest[0])
+        digest.update(np.packbits(G.alive).tobytes())
+    else:
+        digest.update(repr(list(G.edges())).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class CentralityCache:
+    """
+    LRU cache of edge centralities keyed by edge-set fingerprint and metric.
+
+    Scores are stored as one NumPy array in ``G.edges()`` order, which the
+    fingerprint pins down, and turned back into an edge dict on a hit. The
+    least recently used entries are evicted once the arrays exceed
+    ``max_bytes``. With ``directory`` set, every entry is also written there as
+    a ``.npy`` file and read back on a memory miss, so the cache survives the
+    process and is shared by worker processes. Disk entries are keyed by the
+    library version too, so an upgrade never serves scores of an older metric
+    implementation.
+
+    The disk tier is kept under ``max_disk_bytes`` (None for no limit) by
+    deleting the least recently used files, oldest modification time first;
+    reading an entry touches its file. Entries of older versions are never
+    read again, so they are the first to go. The limit is checked against
+    this process's own writes between scans of the directory, so processes
+    sharing it can briefly overshoot it together.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, directory=None, version=__version__,
+                 max_disk_bytes=DEFAULT_MAX_DISK_BYTES):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.version = version
+        self.max_disk_bytes = max_disk_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.disk_size = 0  # Bytes on disk as of the last scan, plus this process's writes since
+        self.hits = 0
+        self.misses = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self.prune()
+
+    def __getstate__(self):
+        # Worker processes start with an empty memory tier and share only the disk tier
+        state = dict(self.__dict__, entries=OrderedDict(), size=0)
+        return state
+
+    def _path(self, key):
+        fingerprint, metric = key
+        return os.path.join(self.directory, f"{metric}-{fingerprint}-{self.version}.npy")
+
+    def _remember(self, key, scores):
+        self.entries[key] = scores
+        self.size += scores.nbytes
+        while self.size > self.max_bytes and self.entries:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= evicted.nbytes
+
+    def _disk_entries(self):
+        # (mtime, size, path) of every disk entry, least recently used first
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if not _ENTRY_NAME.search(entry.name):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue  # Removed by another process meanwhile
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        return sorted(entries)
+
+    def prune(self, max_disk_bytes=None):
+        """
+        Deletes the least recently used disk entries until the rest fit in
+        ``max_disk_bytes``, which defaults to ``self.max_disk_bytes``.
+        """
+        if max_disk_bytes is None:
+            max_disk_bytes = self.max_disk_bytes
+        if self.directory is None:
+            return
+        entries = self._disk_entries()
+        self.disk_size = sum(size for _, size, _ in entries)
+        if max_disk_bytes is None:
+            return
+        for _, size, path in entries:
+            if self.disk_size <= max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass  # Already removed by another process
+            self.disk_size -= size
+
+    def clear(self):
+        """
+        Removes every entry from memory and, with a directory, from disk.
+        """
+        self.entries.clear()
+        self.size = 0
+        self.prune(0)
+
+    def get(self, G, metric):
+        """
+        Returns the cached edge centralities of G's current edge set, or None.
+        """
+        key = (edge_set_fingerprint(G), metric)
+        scores = self.entries.get(key)
+        if scores is not None:
+            self.entries.move_to_end(key)
+        elif self.directory is not None and os.path.exists(self._path(key)):
+            try:
+                scores = np.load(self._path(key))
+            except (OSError, ValueError):
+                scores = None
+            if scores is not None:
+                self._remember(key, scores)
+                try:
+                    os.utime(self._path(key))  # Most recently used; see prune
+                except OSError:
+                    pass
+        if scores is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return dict(zip(G.edges(), scores.tolist()))
+
+    def put(self, G, metric, centrality):
+        """
+        Stores edge centralities computed for G's current edge set.
+        """
+        key = (edge_set_fingerprint(G), metric)
+        scores = np.asarray([centrality[edge] for edge in G.edges()])
+        if scores.dtype == object:
+            return  # Not a plain numeric score per edge; nothing to gain from caching it
+        self._remember(key, scores)
+        if self.directory is not None:
+            target = self._path(key)
+            temporary = f"{target}.{os.getpid()}.tmp.npy"
+            try:
+                np.save(temporary, scores)
+                os.replace(temporary, target)
+                self.disk_size += os.path.getsize(target)
+            except OSError:
+                pass
+            if self.max_disk_bytes is not None and self.disk_size > self.max_disk_bytes:
+                self.prune()
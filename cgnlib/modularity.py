@@ -0,0 +1,145 @@
+import bisect
+from collections import deque
+
+
+class ModularityTracker:
+    """
+    Maintains the connected components of a shrinking graph and their modularity
+    with respect to the original graph.
+
+    Each community keeps its internal edge weight and degree sum in the original
+    graph (unweighted edges count 1), so removing an edge only costs a bounded bidirectional BFS between
+    its endpoints, and a split only rescans the smaller side. Contributions are
+    computed and summed with the same float operations as
+    ``nx.community.modularity``, in ``nx.connected_components`` order, so for
+    unweighted graphs the values are identical to a full recomputation.
+    """
+
+    def __init__(self, G):
+        """
+        Args:
+            G (nx.Graph or GraphCore): The original graph; the tracked graph starts as a copy of it.
+        """
+        self.G = G
+        self.degree = dict(G.degree(weight='weight'))
+        deg_sum = sum(self.degree.values())
+        self.m = deg_sum / 2
+        self.norm = 1 / deg_sum ** 2 if deg_sum else 0
+        self.position = {node: i for i, node in enumerate(G)}
+
+        self.components = {}
+        self.membership = {}
+        self.internal = {}
+        self.degree_sum = {}
+        self.first = {}
+        self.order = []
+        self.splits = 0
+        self._next_id = 0
+        for component in self._connected_components(G):
+            self._add_component(component)
+
+    @staticmethod
+    def _connected_components(G):
+        # Same sets in the same order as nx.connected_components, for any graph with G[node] adjacency
+        seen = set()
+        for source in G:
+            if source in seen:
+                continue
+            component = {source}
+            queue = deque([source])
+            while queue:
+                for nbr in G[queue.popleft()]:
+                    if nbr not in component:
+                        component.add(nbr)
+                        queue.append(nbr)
+            seen |= component
+            yield component
+
+    def _add_component(self, nodes):
+        cid = self._next_id
+        self._next_id += 1
+        internal = 0
+        for node in nodes:
+            self.membership[node] = cid
+        for node in nodes:
+            position = self.position[node]
+            for nbr, data in self.G[node].items():
+                if self.membership.get(nbr) == cid and self.position[nbr] >= position:
+                    internal += data.get('weight', 1)
+        self.components[cid] = nodes
+        self.internal[cid] = internal
+        self.degree_sum[cid] = sum(self.degree[node] for node in nodes)
+        self.first[cid] = min(self.position[node] for node in nodes)
+        bisect.insort(self.order, (self.first[cid], cid))
+        return cid
+
+    def _contribution(self, cid):
+        degree_sum = self.degree_sum[cid]
+        return self.internal[cid] / self.m - 1 * degree_sum * degree_sum * self.norm
+
+    def modularity(self):
+        """
+        Returns the modularity of the current components in the original graph.
+        """
+        if not self.m:
+            return 0
+        return sum(self._contribution(cid) for _, cid in self.order)
+
+    def communities(self):
+        """
+        Returns copies of the current components in ``nx.connected_components`` order.
+        """
+        return [set(self.components[cid]) for _, cid in self.order]
+
+    @staticmethod
+    def _separated_side(graph, u, v):
+        """
+        Runs interleaved BFS from u and v in the current graph. Returns the node set
+        of the side that is exhausted first, or None if the searches meet.
+        """
+        if u == v:
+            return None
+        seen = ({u}, {v})
+        queues = (deque([u]), deque([v]))
+        while True:
+            side = 0 if len(seen[0]) <= len(seen[1]) else 1
+            node = queues[side].popleft()
+            for nbr in graph[node]:
+                if nbr in seen[1 - side]:
+                    return None
+                if nbr not in seen[side]:
+                    seen[side].add(nbr)
+                    queues[side].append(nbr)
+            if not queues[side]:
+                return seen[side]
+
+    def remove_edge(self, graph, u, v):
+        """
+        Updates the components after the edge (u, v) was removed from ``graph``.
+
+        Must be called after every single removal, before the next edge is
+        removed, so that the tracked components match the graph.
+
+        Returns:
+            tuple: Ids of the two resulting components if the removal split one, else None.
+        """
+        side = self._separated_side(graph, u, v)
+        if side is None:
+            return None
+
+        self.splits += 1
+        cid = self.membership[u]
+        rest = self.components[cid]
+        rest -= side
+        self.order.remove((self.first[cid], cid))
+        new_cid = self._add_component(side)
+
+        # Edges of the original graph between the two halves stop being internal
+        cut = sum(data.get('weight', 1) for node in side for nbr, data in self.G[node].items()
+                  if self.membership.get(nbr) == cid)
+        self.internal[cid] -= self.internal[new_cid] + cut
+        self.degree_sum[cid] -= self.degree_sum[new_cid]
+        if self.first[cid] >= self.first[new_cid]:
+            self.first[cid] = min(self.position[node] for node in rest)
+        bisect.insort(self.order, (self.first[cid], cid))
+        return cid, new_cid
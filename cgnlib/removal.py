@@ -0,0 +1,75 @@
+import heapq
+import math
+
+
+# Removal policies pick the edges detect_gn removes in one round. They are
+# called with the edge centralities of the round (in G.edges() order) and the
+# component id of every node, and return the edges to remove. Removing more
+# edges per round means fewer centrality recomputations, at the cost of
+# following the exact Girvan-Newman order less closely. Larger batches also
+# make modularity jumpier between rounds, so they combine better with a
+# Patience or Never stopping policy than with FirstDrop.
+
+
+class MaxTies:
+    """
+    Removes every edge whose centrality equals the maximum exactly (the classic detect_gn rule).
+    """
+
+    def __call__(self, centrality, membership):
+        highest = max(centrality.values())
+        return [edge for edge, value in centrality.items() if value == highest]
+
+
+class NearTies:
+    """
+    Removes every edge within a relative ``epsilon`` of the maximum, so scores
+    that differ only by floating-point noise are treated as ties.
+    """
+
+    def __init__(self, epsilon=1e-9):
+        self.epsilon = epsilon
+
+    def __call__(self, centrality, membership):
+        highest = max(centrality.values())
+        threshold = highest - self.epsilon * abs(highest)
+        return [edge for edge, value in centrality.items() if value >= threshold]
+
+
+class TopK:
+    """
+    Removes the ``k`` edges of highest centrality; ties go to the earlier edge.
+    """
+
+    def __init__(self, k):
+        self.k = k
+
+    def __call__(self, centrality, membership):
+        return heapq.nlargest(self.k, centrality, key=centrality.get)
+
+
+class TopFraction:
+    """
+    Removes the given fraction of the remaining edges (at least one) with the highest centrality.
+    """
+
+    def __init__(self, fraction):
+        self.fraction = fraction
+
+    def __call__(self, centrality, membership):
+        k = max(1, math.ceil(self.fraction * len(centrality)))
+        return heapq.nlargest(k, centrality, key=centrality.get)
+
+
+class OnePerComponent:
+    """
+    Removes the edge of highest centrality in every connected component that still has edges.
+    """
+
+    def __call__(self, centrality, membership):
+        best = {}
+        for edge, value in centrality.items():
+            component = membership[edge[0]]
+            if component not in best or value > best[component][1]:
+                best[component] = (edge, value)
+        return [edge for edge, _ in best.values()]
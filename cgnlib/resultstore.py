@@ -0,0 +1,50 @@
+import json
+import os
+
+from cgnlib._version import __version__
+
+
+class ResultStore:
+    """
+    Append-only JSON Lines store of finished experiment results.
+
+    Each line holds one result row keyed by the dataset's content digest,
+    the centrality metric and the library version, so a result is reused
+    only while all three still match. Rows are flushed and synced as soon as
+    they are written, and a line truncated by a crash is ignored on load.
+    """
+
+    def __init__(self, path, version=__version__):
+        self.path = path
+        self.version = version
+        self.entries = {}
+        self._terminated = True
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    self._terminated = line.endswith('\n')
+                    try:
+                        entry = json.loads(line)
+                        self.entries[(entry['digest'], entry['metric'], entry['version'])] = entry['result']
+                    except (ValueError, KeyError, TypeError):
+                        continue
+
+    def get(self, digest, metric):
+        """
+        Returns the stored result row for a dataset digest and metric, or None.
+        """
+        return self.entries.get((digest, metric, self.version))
+
+    def put(self, digest, metric, result):
+        """
+        Stores a result row and appends it to the file immediately.
+        """
+        self.entries[(digest, metric, self.version)] = result
+        entry = {'digest': digest, 'metric': metric, 'version': self.version, 'result': result}
+        with open(self.path, 'a', encoding='utf-8') as file:
+            if not self._terminated:
+                file.write('\n')  # Close off a line truncated by an earlier crash
+                self._terminated = True
+            file.write(json.dumps(entry) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
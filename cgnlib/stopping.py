@@ -0,0 +1,78 @@
+from collections import namedtuple
+
+
+# Snapshot handed to stopping policies at the start of every detect_gn iteration
+IterationState = namedtuple('IterationState', [
+    'iteration',             # number of removal rounds done so far
+    'modularity',            # current modularity, rounded as detect_gn compares it
+    'best_modularity',       # best modularity seen so far
+    'iterations_since_best', # rounds since the best modularity was last reached
+    'num_communities',       # current number of connected components
+    'elapsed',               # seconds since the run started
+])
+
+
+class FirstDrop:
+    """
+    Stops at the first drop below the best modularity (the classic detect_gn rule).
+    """
+
+    def __call__(self, state):
+        return state.modularity < state.best_modularity
+
+
+class Patience:
+    """
+    Stops once the best modularity has not been reached for ``n`` consecutive rounds.
+    """
+
+    def __init__(self, n):
+        self.n = n
+
+    def __call__(self, state):
+        return state.iterations_since_best > self.n
+
+
+class TargetCommunities:
+    """
+    Stops as soon as the graph has split into at least ``k`` communities.
+    """
+
+    def __init__(self, k):
+        self.k = k
+
+    def __call__(self, state):
+        return state.num_communities >= self.k
+
+
+class TimeBudget:
+    """
+    Stops once the run has taken ``seconds`` of wall-clock time.
+    """
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def __call__(self, state):
+        return state.elapsed >= self.seconds
+
+
+class Never:
+    """
+    Never stops early: the run continues until every edge is removed and records the full hierarchy.
+    """
+
+    def __call__(self, state):
+        return False
+
+
+class AnyOf:
+    """
+    Stops when any of the given policies would stop.
+    """
+
+    def __init__(self, *policies):
+        self.policies = policies
+
+    def __call__(self, state):
+        return any(policy(state) for policy in self.policies)
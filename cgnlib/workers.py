@@ -0,0 +1,86 @@
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+# Work handed to each worker process per map call, relative to the pool size
+CHUNKS_PER_WORKER = 4
+
+# Identifies a map call, so workers set up its payload once however many chunks they run
+_calls = itertools.count()
+
+# The call whose payload a worker process set up last, and the result
+_worker_call = None
+_worker_state = None
+
+
+def _identity(payload):
+    return payload
+
+
+def _run_chunk(function, setup, call, payload, items):
+    global _worker_call, _worker_state
+    if _worker_call != call:
+        _worker_state = None  # Drop the previous call's state before building the new one
+        _worker_state = setup(payload)
+        _worker_call = call
+    return [function(_worker_state, item) for item in items]
+
+
+class WorkerPool:
+    """
+    Process pool started on first use and reused by every parallel computation
+    of its owner, so repeated calls do not pay for starting processes again.
+
+    The payload of a call (e.g. the adjacency matrix) travels with each chunk
+    of its items; every worker builds its state from it once per call and keeps
+    it until the next one.
+    """
+
+    def __init__(self, workers):
+        self.workers = workers
+        self._executor = None
+
+    def map(self, function, items, payload=None, setup=_identity):
+        """
+        Returns ``[function(state, item) for item in items]``, computed in the pool.
+
+        Args:
+            function: Module-level function of the worker state and one item.
+            items (list): Items to map over, split into contiguous chunks.
+            payload: Picklable data shared by all items of this call.
+            setup: Module-level function building the worker state from the payload.
+        """
+        items = list(items)
+        if not items:
+            return []
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        call = next(_calls)
+        size = max(1, len(items) // (CHUNKS_PER_WORKER * self.workers))
+        futures = [self._executor.submit(_run_chunk, function, setup, call, payload, items[start:start + size])
+                   for start in range(0, len(items), size)]
+        return [result for future in futures for result in future.result()]
+
+    def close(self):
+        """
+        Shuts the worker processes down; the next map starts new ones.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def pool_map(function, items, payload=None, setup=_identity, workers=None, pool=None):
+    """
+    Maps ``function`` over ``items`` in ``pool``, or in a pool of ``workers``
+    processes started for this call only when no pool is given.
+    """
+    if pool is not None:
+        return pool.map(function, items, payload, setup)
+    with WorkerPool(workers) as pool:
+        return pool.map(function, items, payload, setup)
@@ -1,4 +1,5 @@
 ﻿import io
+import re
 from os.path import abspath, dirname, join
 from setuptools import find_packages, setup
 
@@ -8,18 +9,19 @@ LOAD_TEXT = lambda name: io.open(join(HERE, name), encoding='UTF-8').read()
 DESCRIPTION = '\n\n'.join(LOAD_TEXT(_) for _ in [
     'README.rst'
 ])
+VERSION = re.search(r"__version__ = '([^']+)'", LOAD_TEXT('cgnlib/_version.py')).group(1)
 
 setup(
   name = 'cgnlib',      
   packages = ['cgnlib'], 
-  version = '0.1.7', 
+  version = VERSION, 
   license='MIT', 
   description = 'CGNLib, a Python library, enhances GN by allowing experimentation with different centrality metric. This flexibility can improve community detection results.',
   long_description=DESCRIPTION,
   author = 'chinnapongpsu',                 
   author_email = 'chinnapong.a@psu.ac.th',     
   url = 'https://github.com/chinnapongpsu/cgnlib',  
-  download_url = 'https://github.com/chinnapongpsu/cgnlib/archive/refs/tags/0.1.7.zip',  
+  download_url = f'https://github.com/chinnapongpsu/cgnlib/archive/refs/tags/{VERSION}.zip',  
   keywords = [
     'cgn',
     "Community Detection"
@@ -30,6 +32,8 @@ setup(
               ],
   install_requires=[          
           'networkx',
+          'numpy',
+          'scipy',
           'igraph',
           'netcenlib',
           'matplotlib'
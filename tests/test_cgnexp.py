@@ -0,0 +1,92 @@
+import importlib
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from cgnlib import cgnexp
+
+DATASETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'DATASETS')
+FILES = [os.path.join(DATASETS, 'zachary.txt'), os.path.join(DATASETS, 'soc-dolphins.txt')]
+
+# cgnlib.cgnexp is shadowed by the class of the same name in the package namespace
+experiments = importlib.import_module('cgnlib.cgnexp')
+
+needs_fork = pytest.mark.skipif(multiprocessing.get_start_method() != 'fork',
+                                reason="workers only see the patched runner when forked")
+
+
+@pytest.fixture
+def misbehaving(monkeypatch):
+    """
+    Makes 'degree' slow, and adds a 'hang' and a 'crash' metric that stand
+    in for a stuck and a dying task.
+    """
+    run = experiments._run_experiment
+
+    def patched(graph_data, dataset_name, metric, **options):
+        if metric == 'hang':
+            time.sleep(60)
+        if metric == 'crash':
+            os._exit(3)
+        if metric == 'degree':
+            time.sleep(0.5)  # Finishes after the tasks submitted behind it
+        return run(graph_data, dataset_name, metric, **options)
+
+    monkeypatch.setattr(experiments, '_run_experiment', patched)
+
+
+def _pairs(results):
+    return [(result['Dataset'], result['Centrality Metric']) for result in results]
+
+
+@needs_fork
+def test_parallel_results_keep_task_order(misbehaving):
+    exp = cgnexp(FILES)
+    exp.run_experiments(metrics=['degree', 'closeness', 'l1'], workers=3)
+    assert _pairs(exp.results) == [(dataset, metric) for dataset in ('zachary', 'soc-dolphins')
+                                   for metric in ('degree', 'closeness', 'l1')]
+    assert exp.failures == []
+
+
+@needs_fork
+def test_parallel_records_timeouts_and_crashes(misbehaving):
+    exp = cgnexp(FILES[:1])
+    start = time.monotonic()
+    exp.run_experiments(metrics=['hang', 'closeness', 'crash', 'bogus', 'l1'], workers=2, timeout=2)
+    assert time.monotonic() - start < 30
+    assert _pairs(exp.results) == [('zachary', 'closeness'), ('zachary', 'l1')]
+    errors = {failure['Centrality Metric']: failure['Error'] for failure in exp.failures}
+    assert list(errors) == ['hang', 'crash', 'bogus']
+    assert errors['hang'] == "Timed out after 2 sec"
+    assert errors['crash'] == "Worker exited with code 3"
+    assert errors['bogus'].startswith("ValueError: Unsupported metric")
+
+
+def test_sequential_records_failures_and_continues(monkeypatch):
+    run = experiments._run_experiment
+
+    def patched(graph_data, dataset_name, metric, **options):
+        if metric == 'degree':
+            raise RuntimeError("boom")
+        return run(graph_data, dataset_name, metric, **options)
+
+    monkeypatch.setattr(experiments, '_run_experiment', patched)
+    exp = cgnexp(FILES[:1])
+    exp.run_experiments(metrics=['degree', 'bogus', 'closeness'])
+    assert _pairs(exp.results) == [('zachary', 'closeness')]
+    assert exp.failures == [
+        {'Dataset': 'zachary', 'Centrality Metric': 'degree', 'Error': "RuntimeError: boom"},
+        {'Dataset': 'zachary', 'Centrality Metric': 'bogus', 'Error': "ValueError: Unsupported metric: bogus"},
+    ]
+
+
+@needs_fork
+def test_parallel_matches_sequential():
+    sequential, parallel = cgnexp(FILES), cgnexp(FILES)
+    sequential.run_experiments(metrics=['closeness', 'degree'])
+    parallel.run_experiments(metrics=['closeness', 'degree'], workers=2)
+    keys = ('Dataset', 'Centrality Metric', 'Modularity', 'Number of Communities', 'Coverage')
+    assert [[result[key] for key in keys] for result in parallel.results] == \
+        [[result[key] for key in keys] for result in sequential.results]
@@ -0,0 +1,25 @@
+import os
+
+import pytest
+
+from cgnlib import Patience, cgnlib
+
+DATASETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'DATASETS')
+
+
+@pytest.mark.parametrize('metric', ['closeness', 'betweenness', 'l1'])
+@pytest.mark.parametrize('dataset', ['zachary.txt', 'soc-dolphins.txt'])
+def test_cached_components_match_recomputation(dataset, metric):
+    graph_data = cgnlib(os.path.join(DATASETS, dataset), cache=False)
+    local = graph_data._calculate_local_centrality_for_edges
+    checked = []
+
+    def checked_local(G, components, metric, line_graph, cache):
+        centrality = local(G, components, metric, line_graph, cache)
+        assert centrality == graph_data._compute_centrality_for_edges(G, metric)
+        checked.append(len(components))
+        return centrality
+
+    graph_data._calculate_local_centrality_for_edges = checked_local
+    graph_data.detect_gn(metric, stop=Patience(10))
+    assert checked and max(checked) > 1  # Some rounds ran with several components, some of them cached
@@ -0,0 +1,70 @@
+import os
+import random
+
+import networkx as nx
+import pytest
+
+from cgnlib import TargetCommunities, cgnlib
+from cgnlib.dendrogram import Dendrogram
+from cgnlib.modularity import ModularityTracker
+
+DATASETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'DATASETS')
+
+
+def _recorded_run(G, seed=0):
+    """
+    Removes every edge of G in a random order, recording the splits in a
+    Dendrogram; returns it with the partition after each split, level 0 first.
+    """
+    graph = G.copy()
+    tracker = ModularityTracker(G)
+    dendrogram = Dendrogram(G, tracker.membership, tracker.modularity())
+    partitions = [tracker.communities()]
+    edges = list(G.edges())
+    random.Random(seed).shuffle(edges)
+    for iteration, (u, v) in enumerate(edges):
+        graph.remove_edge(u, v)
+        dendrogram.record_removal(iteration, u, v)
+        split = tracker.remove_edge(graph, u, v)
+        if split is not None:
+            dendrogram.record_split(iteration, *split, tracker.modularity())
+            partitions.append(tracker.communities())
+    dendrogram.finish(tracker.membership)
+    return dendrogram, partitions
+
+
+@pytest.mark.parametrize('G', [nx.karate_club_graph(), nx.disjoint_union(nx.path_graph(4), nx.cycle_graph(5))])
+def test_cut_reproduces_every_level(G):
+    dendrogram, partitions = _recorded_run(G)
+    assert len(dendrogram) == len(partitions) - 1
+    for level, partition in enumerate(partitions):
+        assert dendrogram.cut(level) == partition
+        assert dendrogram.modularity[level] == pytest.approx(nx.community.modularity(G, partition))
+
+
+def test_level_for():
+    G = nx.disjoint_union(nx.path_graph(4), nx.cycle_graph(5))  # Starts with two components
+    dendrogram, partitions = _recorded_run(G)
+    assert dendrogram.level_for(1) == 0
+    for k in range(2, G.number_of_nodes() + 1):
+        assert len(partitions[dendrogram.level_for(k)]) == k
+    assert dendrogram.level_for(100) == len(dendrogram)
+
+
+def test_removed_edges_and_invalid_level():
+    G = nx.karate_club_graph()
+    dendrogram, _ = _recorded_run(G)
+    assert set(map(frozenset, dendrogram.removed_edges())) == set(map(frozenset, G.edges()))
+    assert len(dendrogram.removed_edges(iteration=0)) == 1
+    with pytest.raises(ValueError):
+        dendrogram.labels(len(dendrogram) + 1)
+
+
+def test_detect_gn_dendrogram_matches_communities():
+    graph_data = cgnlib(os.path.join(DATASETS, 'zachary.txt'), cache=False)
+    graph_data.detect_gn('betweenness', stop=TargetCommunities(4))
+    dendrogram = graph_data.dendrogram
+    final = dendrogram.cut(len(dendrogram))
+    assert len(final) == 4
+    assert dendrogram.cut(dendrogram.level_for(4)) == final
+    assert sum(len(community) for community in final) == graph_data.core.number_of_nodes()
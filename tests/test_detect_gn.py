@@ -0,0 +1,15 @@
+import os
+
+import pytest
+
+from cgnlib import Never, Patience, cgnlib
+
+DATASETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'DATASETS')
+
+
+@pytest.mark.parametrize('dataset, stop', [('zachary.txt', Never()), ('Les.txt', Patience(3))])
+def test_l1_survives_isolated_nodes(dataset, stop):
+    # Removals that isolate a node leave a component whose line graph is empty
+    graph_data = cgnlib(os.path.join(DATASETS, dataset), cache=False)
+    communities = graph_data.detect_gn('l1', stop=stop)
+    assert sum(len(community) for community in communities) == graph_data.core.number_of_nodes()
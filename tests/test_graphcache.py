@@ -0,0 +1,83 @@
+import os
+
+import numpy as np
+
+from cgnlib import graphcache
+from cgnlib.graphcache import cache_path, load_cached_graph, read_cache
+
+
+def _same_graph(a, b):
+    (edges_a, core_a), (edges_b, core_b) = a, b
+    assert edges_a.labels == edges_b.labels
+    assert edges_a.src.tolist() == edges_b.src.tolist()
+    assert core_a.edges() == core_b.edges()
+    for name in ('indptr', 'indices', 'entry_edge', 'src', 'dst'):
+        assert np.array_equal(getattr(core_a, name), getattr(core_b, name))
+
+
+def _count_parses(monkeypatch):
+    calls = []
+    parse = graphcache.load_edge_list
+    monkeypatch.setattr(graphcache, 'load_edge_list', lambda path: calls.append(path) or parse(path))
+    return calls
+
+
+def test_cached_load_matches_parsing(tmp_path, monkeypatch):
+    path = tmp_path / 'graph.txt'
+    path.write_text("a b 2\nb c\nc a 0.5\nd d\n")
+    parses = _count_parses(monkeypatch)
+
+    first = load_cached_graph(str(path))
+    second = load_cached_graph(str(path))
+    assert len(parses) == 1 and os.path.exists(cache_path(str(path)))
+    assert isinstance(second[1].indptr, np.memmap)
+    _same_graph(first, second)
+    _same_graph(second, load_cached_graph(str(path), cache=False))
+    assert second[1].weights.tolist() == first[1].weights.tolist()
+
+
+def test_changed_file_invalidates_the_cache(tmp_path, monkeypatch):
+    path = tmp_path / 'graph.txt'
+    path.write_text("a b\nb c\n")
+    load_cached_graph(str(path))
+    parses = _count_parses(monkeypatch)
+
+    path.write_text("a b\nb c\nc d\n")
+    edge_list, core = load_cached_graph(str(path))
+    assert len(parses) == 1
+    assert edge_list.labels == ['a', 'b', 'c', 'd'] and core.number_of_edges() == 3
+
+
+def test_touched_file_is_hashed_once(tmp_path, monkeypatch):
+    path = tmp_path / 'graph.txt'
+    path.write_text("a b\nb c\n")
+    load_cached_graph(str(path))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    parses = _count_parses(monkeypatch)
+    hashes = []
+    digest = graphcache.file_digest
+    monkeypatch.setattr(graphcache, 'file_digest', lambda path: hashes.append(path) or digest(path))
+
+    load_cached_graph(str(path))
+    load_cached_graph(str(path))
+    assert parses == [] and len(hashes) == 1  # The second load trusts the rewritten mtime
+    assert read_cache(cache_path(str(path)))[1][1] == os.stat(path).st_mtime_ns
+
+
+def test_stale_version_or_corrupt_cache_is_rebuilt(tmp_path, monkeypatch):
+    path = tmp_path / 'graph.txt'
+    path.write_text("a b\n")
+    load_cached_graph(str(path))
+    parses = _count_parses(monkeypatch)
+
+    monkeypatch.setattr(graphcache, 'CACHE_VERSION', graphcache.CACHE_VERSION + 1)
+    load_cached_graph(str(path))
+    assert len(parses) == 1
+    load_cached_graph(str(path))
+    assert len(parses) == 1  # Rewritten with the new version
+
+    with open(cache_path(str(path)), 'wb') as file:
+        file.write(b'not a zip file')
+    edge_list, _ = load_cached_graph(str(path))
+    assert len(parses) == 2 and edge_list.labels == ['a', 'b']
@@ -0,0 +1,71 @@
+import os
+
+import networkx as nx
+import pytest
+
+from cgnlib import cgnlib
+from cgnlib.graphcore import GraphCore
+from cgnlib.loader import load_edge_list
+
+DATASETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'DATASETS')
+
+
+def _assert_same_order(core, G):
+    assert list(core) == list(G)
+    assert core.edges() == list(G.edges())
+    for node in G:
+        assert list(core[node]) == list(G[node])
+    assert core.degree() == list(G.degree())
+    assert core.number_of_edges() == G.number_of_edges()
+
+
+@pytest.mark.parametrize('G', [nx.karate_club_graph(), nx.les_miserables_graph(),
+                               nx.relabel_nodes(nx.gnm_random_graph(40, 90, seed=2), str)])
+def test_from_networkx_keeps_networkx_order(G):
+    _assert_same_order(GraphCore.from_networkx(G), G)
+
+
+def test_from_edge_list_matches_networkx_loading(tmp_path):
+    # Repeated edges keep the position of their first line and the weight of their last
+    path = tmp_path / 'graph.txt'
+    path.write_text("b a 1\nc b 2\na b 3\nd d 4\na c 5\n")
+    G = nx.Graph()
+    for line in path.read_text().splitlines():
+        u, v, w = line.split()
+        G.add_edge(u, v, weight=float(w))
+    core = GraphCore.from_edge_list(load_edge_list(str(path)))
+    _assert_same_order(core, G)
+    assert core.degree(weight='weight') == list(G.degree(weight='weight'))
+
+
+def test_removals_touch_only_the_copy():
+    G = nx.karate_club_graph()
+    core = GraphCore.from_networkx(G)
+    copy = core.copy()
+    assert copy.alive is core.alive  # Shared until the first removal
+
+    removed = list(G.edges())[::4]
+    for u, v in removed:
+        copy.remove_edge(v, u)
+    G.remove_edges_from(removed)
+
+    assert copy.alive is not core.alive
+    assert core.alive.all() and core.number_of_edges() == len(core.src)
+    assert int(copy.alive.sum()) == copy.number_of_edges() == G.number_of_edges()
+    _assert_same_order(copy, G)
+    assert not copy.has_edge(*removed[0]) and core.has_edge(*removed[0])
+    assert list(copy.to_networkx().edges(data='weight')) == list(G.edges(data='weight'))
+    with pytest.raises(nx.NetworkXError):
+        copy.remove_edge(*removed[0])
+
+
+def test_graph_set_assignment_rebuilds_the_core():
+    graph_data = cgnlib(os.path.join(DATASETS, 'zachary.txt'), cache=False)
+    graph_data.compute_edge_centralities(metrics=['degree'])
+    G = nx.path_graph(5)
+    graph_data.GraphSet = G
+
+    assert graph_data.edge_list is None
+    assert graph_data.initial_centrality == {}
+    _assert_same_order(graph_data.core, G)
+    assert graph_data.detect_gn('closeness')
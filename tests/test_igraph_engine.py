@@ -0,0 +1,63 @@
+import os
+
+import networkx as nx
+import pytest
+
+from cgnlib import cgnlib
+from cgnlib.igraph_engine import IGRAPH_METRICS, IgraphEdgeGraph, edge_betweenness, line_graph_centrality
+
+DATASETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'DATASETS')
+
+
+def _centralities(dataset, metric, removed=0):
+    """
+    Edge centralities of both engines, after removing every ``removed``-th edge
+    so the graph falls apart into several components.
+    """
+    path = os.path.join(DATASETS, dataset)
+    scores = []
+    for engine in ('networkx', 'igraph'):
+        graph_data = cgnlib(path, cache=False, engine=engine)
+        graph = graph_data.core.copy()
+        for u, v in graph.edges()[::removed] if removed else []:
+            graph.remove_edge(u, v)
+        scores.append(graph_data._calculate_centrality_for_edges(graph, metric))
+    return scores
+
+
+@pytest.mark.parametrize('metric', [metric for metric in IGRAPH_METRICS if metric != 'degree'])
+@pytest.mark.parametrize('dataset, removed', [('zachary.txt', 0), ('Les.txt', 0), ('soc-dolphins.txt', 0),
+                                              ('zachary.txt', 3), ('soc-dolphins.txt', 2)])
+def test_line_graph_metrics_match_networkx(dataset, removed, metric):
+    expected, actual = _centralities(dataset, metric, removed)
+    assert list(actual) == list(expected)
+    assert actual == pytest.approx(expected, rel=1e-9, abs=1e-12)
+
+
+def test_line_graph_degree_matches_networkx():
+    # detect_gn takes degree from its edge formula, so the engine path is checked directly
+    G = nx.les_miserables_graph()
+    edge_graph = IgraphEdgeGraph.from_graph(G)
+    L = nx.line_graph(G)
+    degree = {frozenset(edge): value for edge, value in L.degree()}
+    scores = line_graph_centrality(edge_graph.line_graph(), 'degree')
+    assert scores == [degree[frozenset(edge)] for edge in edge_graph.edges]
+
+
+def test_edge_graph_stays_aligned_with_removals():
+    G = nx.les_miserables_graph()
+    edge_graph = IgraphEdgeGraph.from_graph(G)
+    removed = list(G.edges())[1::4]
+    edge_graph.remove_edges([(v, u) for u, v in removed])
+    G.remove_edges_from(removed)
+    assert edge_graph.edges == list(G.edges()) and len(edge_graph) == G.number_of_edges()
+    index = edge_graph.node_index
+    assert [(index[u], index[v]) for u, v in G.edges()] == [tuple(edge.tuple) for edge in edge_graph.graph.es]
+
+
+def test_edge_betweenness_matches_networkx():
+    for G in (nx.karate_club_graph(), nx.disjoint_union(nx.les_miserables_graph(), nx.path_graph(5))):
+        expected = nx.edge_betweenness_centrality(G, normalized=False)
+        actual = edge_betweenness(G)
+        assert list(actual) == list(G.edges())
+        assert actual == pytest.approx(expected, rel=1e-9)
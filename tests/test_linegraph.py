@@ -0,0 +1,64 @@
+import os
+
+import networkx as nx
+import pytest
+
+from cgnlib import Patience, cgnlib
+from cgnlib.linegraph import LineGraph
+
+DATASETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'DATASETS')
+
+
+def _adjacency(line_graph):
+    return {line_graph.edges[i]: {line_graph.edges[j] for j in line_graph.neighbors(i).tolist()}
+            for i in range(len(line_graph.edges)) if line_graph.alive[i]}
+
+
+def _expected_adjacency(G):
+    # nx.line_graph names vertices by the edge orientation it met them in, which may differ from G.edges()
+    L = nx.line_graph(G)
+    key = {frozenset(edge): edge for edge in G.edges()}
+    return {key[frozenset(e)]: {key[frozenset(f)] for f in L[e]} for e in L}
+
+
+@pytest.mark.parametrize('G', [nx.karate_club_graph(), nx.les_miserables_graph(), nx.star_graph(5),
+                               nx.gnm_random_graph(60, 150, seed=1)])
+def test_adjacency_matches_networkx(G):
+    assert _adjacency(LineGraph.from_graph(G)) == _expected_adjacency(G)
+
+
+def test_removal_matches_rebuilt_line_graph():
+    G = nx.karate_club_graph()
+    line_graph = LineGraph.from_graph(G)
+    removed = list(G.edges())[::3]
+    line_graph.remove_edges([(v, u) for u, v in removed])  # Either orientation
+    G.remove_edges_from(removed)
+
+    assert line_graph.alive_edges() == list(G.edges())
+    assert _adjacency(line_graph) == _expected_adjacency(G)
+    for i in range(len(line_graph.edges)):
+        assert line_graph.degree[i] == (len(line_graph.neighbors(i)) if line_graph.alive[i] else 0)
+
+
+def test_to_networkx_matches_networkx_line_graph():
+    G = nx.les_miserables_graph()
+    H, labels = LineGraph.from_graph(G).to_networkx()
+    assert sorted(labels.values()) == list(range(1, G.number_of_edges() + 1))
+    edge_of = {label: edge for edge, label in labels.items()}
+    assert {edge_of[node]: {edge_of[nbr] for nbr in H[node]} for node in H} == _expected_adjacency(G)
+
+
+def test_detect_gn_keeps_its_line_graph_in_sync():
+    graph_data = cgnlib(os.path.join(DATASETS, 'zachary.txt'), cache=False)
+    calculate = graph_data._calculate_centrality_for_edges
+    rounds = []
+
+    def checked(G, metric='closeness', line_graph=None, approx=None, seed=None):
+        assert line_graph.alive_edges() == list(G.edges())
+        assert _adjacency(line_graph) == _adjacency(LineGraph.from_graph(G))
+        rounds.append(G.number_of_edges())
+        return calculate(G, metric, line_graph, approx, seed)
+
+    graph_data._calculate_centrality_for_edges = checked
+    graph_data.detect_gn('pagerank', stop=Patience(5))
+    assert len(rounds) > 1 and rounds[-1] < rounds[0]
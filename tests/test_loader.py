@@ -0,0 +1,60 @@
+import bz2
+import gzip
+
+import networkx as nx
+import pytest
+
+from cgnlib.loader import load_edge_list
+
+TEXT = "# comment\n% also a comment\n\na b\nb c 2.5\n\nc a\n"
+
+
+def _write(path, opener, text=TEXT):
+    with opener(path, 'wt', encoding='utf-8') as file:
+        file.write(text)
+    return str(path)
+
+
+@pytest.mark.parametrize('opener, name', [(open, 'graph.txt'), (gzip.open, 'graph.txt.gz'),
+                                          (bz2.open, 'graph.bz2'), (gzip.open, 'no-suffix')])
+def test_compressed_files_are_detected_from_their_content(tmp_path, opener, name):
+    edge_list = load_edge_list(_write(tmp_path / name, opener))
+    assert edge_list.labels == ['a', 'b', 'c']
+    assert edge_list.src.tolist() == [0, 1, 2]
+    assert edge_list.dst.tolist() == [1, 2, 0]
+    assert edge_list.weights.tolist() == [1.0, 2.5, 1.0]  # Missing weights are 1 once any line has one
+
+
+def test_unweighted_file_has_no_weights(tmp_path):
+    edge_list = load_edge_list(_write(tmp_path / 'graph.txt', open, "1 2\n2 3\n"))
+    assert edge_list.weights is None
+    assert list(edge_list.to_networkx().edges(data=True)) == [('1', '2', {}), ('2', '3', {})]
+
+
+def test_small_chunks_parse_the_same(tmp_path):
+    text = ''.join(f"{i} {i + 1} {i / 2}\n" for i in range(200))
+    path = _write(tmp_path / 'graph.txt', open, text)
+    whole, chunked = load_edge_list(path), load_edge_list(path, chunk_size=16)
+    assert whole.labels == chunked.labels
+    assert whole.src.tolist() == chunked.src.tolist() and whole.weights.tolist() == chunked.weights.tolist()
+
+
+def test_matches_networkx_with_repeated_edges(tmp_path):
+    text = "a b 1\nb a 3\nc c 2\na c 4\n"
+    G = nx.Graph()
+    for line in text.splitlines():
+        u, v, w = line.split()
+        G.add_edge(u, v, weight=float(w))
+    edge_list = load_edge_list(_write(tmp_path / 'graph.txt', open, text))
+    H = edge_list.to_networkx()
+    assert list(H) == list(G) and list(H.edges(data=True)) == list(G.edges(data=True))
+    assert (edge_list.csr().toarray() == nx.to_numpy_array(G, nodelist=edge_list.labels)).all()
+
+
+@pytest.mark.parametrize('line, message', [("a b c d\n", "Line 2: expected two nodes"),
+                                           ("a b heavy\n", "Line 2: invalid weight 'heavy'"),
+                                           ("a\n", "Line 2: expected two nodes")])
+def test_malformed_lines_raise(tmp_path, line, message):
+    path = _write(tmp_path / 'graph.txt', open, "x y\n" + line)
+    with pytest.raises(ValueError, match=message):
+        load_edge_list(path)
@@ -0,0 +1,50 @@
+import random
+
+import networkx as nx
+import pytest
+
+from cgnlib.graphcore import GraphCore
+from cgnlib.modularity import ModularityTracker
+
+
+def _removal_order(G, seed=0):
+    edges = list(G.edges())
+    random.Random(seed).shuffle(edges)
+    return edges
+
+
+@pytest.mark.parametrize('core', [False, True])
+def test_unweighted_matches_networkx_exactly(core):
+    G = nx.karate_club_graph()
+    for u, v in G.edges():
+        del G[u][v]['weight']
+    graph = GraphCore.from_networkx(G) if core else G.copy()
+    tracker = ModularityTracker(graph.copy() if core else G)
+    for u, v in _removal_order(G):
+        graph.remove_edge(u, v)
+        tracker.remove_edge(graph, u, v)
+        components = list(nx.connected_components(graph.to_networkx() if core else graph))
+        assert tracker.communities() == components
+        assert tracker.modularity() == nx.community.modularity(G, components)
+
+
+def test_weighted_matches_networkx():
+    G = nx.les_miserables_graph()  # Weighted by co-appearances
+    graph = G.copy()
+    tracker = ModularityTracker(G)
+    splits = 0
+    for u, v in _removal_order(G, seed=1):
+        graph.remove_edge(u, v)
+        splits += tracker.remove_edge(graph, u, v) is not None
+        components = list(nx.connected_components(graph))
+        assert tracker.communities() == components
+        assert tracker.modularity() == pytest.approx(nx.community.modularity(G, components, weight='weight'),
+                                                     abs=1e-12)
+    assert splits == tracker.splits == G.number_of_nodes() - 1
+
+
+def test_empty_graph_has_zero_modularity():
+    G = nx.empty_graph(3)
+    tracker = ModularityTracker(G)
+    assert tracker.modularity() == 0
+    assert tracker.communities() == [{0}, {1}, {2}]
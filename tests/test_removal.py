@@ -0,0 +1,51 @@
+import os
+
+import pytest
+
+from cgnlib import MaxTies, NearTies, OnePerComponent, Patience, TopFraction, TopK, cgnlib
+
+DATASETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'DATASETS')
+
+CENTRALITY = {('a', 'b'): 3.0, ('b', 'c'): 1.0, ('c', 'd'): 3.0 - 1e-12, ('d', 'e'): 2.0, ('x', 'y'): 0.5,
+              ('y', 'z'): 0.25}
+MEMBERSHIP = {'a': 0, 'b': 0, 'c': 0, 'd': 0, 'e': 0, 'x': 1, 'y': 1, 'z': 1}
+
+
+def test_policies_pick_the_documented_edges():
+    assert MaxTies()(CENTRALITY, MEMBERSHIP) == [('a', 'b')]
+    assert NearTies()(CENTRALITY, MEMBERSHIP) == [('a', 'b'), ('c', 'd')]
+    assert NearTies(epsilon=0)(CENTRALITY, MEMBERSHIP) == [('a', 'b')]
+    assert TopK(3)(CENTRALITY, MEMBERSHIP) == [('a', 'b'), ('c', 'd'), ('d', 'e')]
+    assert TopK(1)({('a', 'b'): 1.0, ('b', 'c'): 1.0}, MEMBERSHIP) == [('a', 'b')]  # Ties go to the earlier edge
+    assert TopFraction(0.3)(CENTRALITY, MEMBERSHIP) == [('a', 'b'), ('c', 'd')]
+    assert TopFraction(0.01)(CENTRALITY, MEMBERSHIP) == [('a', 'b')]
+    assert OnePerComponent()(CENTRALITY, MEMBERSHIP) == [('a', 'b'), ('x', 'y')]
+
+
+def test_max_ties_removes_every_exact_tie():
+    centrality = {('a', 'b'): 2.0, ('b', 'c'): 2.0, ('c', 'd'): 1.0}
+    assert MaxTies()(centrality, MEMBERSHIP) == [('a', 'b'), ('b', 'c')]
+
+
+def test_default_is_max_ties():
+    path = os.path.join(DATASETS, 'zachary.txt')
+    assert cgnlib(path, cache=False).detect_gn('closeness') == \
+        cgnlib(path, cache=False).detect_gn('closeness', removal=MaxTies())
+
+
+@pytest.mark.parametrize('removal, batch', [(TopK(3), 3), (TopFraction(0.05), None), (OnePerComponent(), None)])
+def test_detect_gn_removes_what_the_policy_returns(removal, batch):
+    graph_data = cgnlib(os.path.join(DATASETS, 'zachary.txt'), cache=False)
+    picked = []
+
+    def recorded(centrality, membership):
+        edges = removal(centrality, membership)
+        picked.append(edges)
+        return edges
+
+    graph_data.detect_gn('betweenness', stop=Patience(3), removal=recorded)
+    dendrogram = graph_data.dendrogram
+    for iteration, edges in enumerate(picked):
+        assert dendrogram.removed_edges(iteration) == edges
+        if batch is not None:
+            assert len(edges) == batch
@@ -0,0 +1,60 @@
+import importlib
+import os
+import shutil
+
+from cgnlib import cgnexp
+from cgnlib.resultstore import ResultStore
+
+DATASETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'DATASETS')
+
+experiments = importlib.import_module('cgnlib.cgnexp')
+
+
+def test_rows_survive_reopening_and_truncated_lines(tmp_path):
+    path = str(tmp_path / 'results.jsonl')
+    store = ResultStore(path)
+    store.put('abc', 'closeness', {'Modularity': 0.4})
+    with open(path, 'a', encoding='utf-8') as file:
+        file.write('{"digest": "abc", "metric": "l1", "ver')  # Cut off by a crash
+
+    store = ResultStore(path)
+    assert store.get('abc', 'closeness') == {'Modularity': 0.4}
+    assert store.get('abc', 'l1') is None
+    store.put('abc', 'l1', {'Modularity': 0.3})
+    assert ResultStore(path).get('abc', 'l1') == {'Modularity': 0.3}
+
+
+def test_rows_of_other_versions_are_not_reused(tmp_path):
+    path = str(tmp_path / 'results.jsonl')
+    ResultStore(path, version='1.0').put('abc', 'closeness', {'Modularity': 0.4})
+    assert ResultStore(path, version='1.1').get('abc', 'closeness') is None
+    assert ResultStore(path, version='1.0').get('abc', 'closeness') == {'Modularity': 0.4}
+
+
+def test_sweep_resumes_from_the_store(tmp_path, monkeypatch):
+    dataset = str(tmp_path / 'zachary.txt')
+    shutil.copy(os.path.join(DATASETS, 'zachary.txt'), dataset)
+    path = str(tmp_path / 'results.jsonl')
+
+    first = cgnexp([dataset])
+    first.run_experiments(metrics=['closeness', 'degree'], store=path)
+
+    ran = []
+    run = experiments._run_experiment
+
+    def counted(graph_data, dataset_name, metric, **options):
+        ran.append(metric)
+        return run(graph_data, dataset_name, metric, **options)
+
+    monkeypatch.setattr(experiments, '_run_experiment', counted)
+    resumed = cgnexp([dataset])
+    resumed.run_experiments(metrics=['closeness', 'l1', 'degree'], store=path)
+    assert ran == ['l1']
+    assert [result['Centrality Metric'] for result in resumed.results] == ['closeness', 'l1', 'degree']
+    assert resumed.results[0] == first.results[0] and resumed.results[2] == first.results[1]
+
+    # Different contents, different digest: nothing is reused
+    with open(dataset, 'a') as file:
+        file.write("1 34\n")
+    cgnexp([dataset]).run_experiments(metrics=['closeness'], store=path)
+    assert ran == ['l1', 'closeness']
@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+from cgnlib import AnyOf, FirstDrop, Never, Patience, TargetCommunities, TimeBudget, cgnlib
+from cgnlib.stopping import IterationState
+
+DATASETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'DATASETS')
+
+
+def _state(**fields):
+    defaults = dict(iteration=5, modularity=0.3, best_modularity=0.4, iterations_since_best=2, num_communities=3,
+                    elapsed=1.0)
+    return IterationState(**dict(defaults, **fields))
+
+
+def test_policies_on_single_states():
+    assert FirstDrop()(_state())
+    assert not FirstDrop()(_state(modularity=0.4))
+    assert Patience(2)(_state(iterations_since_best=3)) and not Patience(2)(_state())
+    assert TargetCommunities(3)(_state()) and not TargetCommunities(4)(_state())
+    assert TimeBudget(1.0)(_state()) and not TimeBudget(2.0)(_state())
+    assert not Never()(_state())
+    assert AnyOf(Never(), TargetCommunities(3))(_state()) and not AnyOf(Never(), TargetCommunities(4))(_state())
+
+
+class _Recorder:
+    """
+    Wraps a stopping policy and keeps every state it was asked about.
+    """
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.states = []
+
+    def __call__(self, state):
+        self.states.append(state)
+        return self.policy(state)
+
+
+@pytest.mark.parametrize('policy', [FirstDrop(), Patience(3), TargetCommunities(5),
+                                    AnyOf(TargetCommunities(8), Patience(2))])
+def test_detect_gn_stops_at_the_first_state_the_policy_accepts(policy):
+    graph_data = cgnlib(os.path.join(DATASETS, 'zachary.txt'), cache=False)
+    recorder = _Recorder(policy)
+    graph_data.detect_gn('closeness', stop=recorder)
+
+    *earlier, last = recorder.states
+    assert policy(last) and not any(policy(state) for state in earlier)
+    assert [state.iteration for state in recorder.states] == list(range(len(recorder.states)))
+    assert last.num_communities == len(graph_data.dendrogram.cut(len(graph_data.dendrogram)))
+
+
+def test_default_is_first_drop():
+    path = os.path.join(DATASETS, 'zachary.txt')
+    assert cgnlib(path, cache=False).detect_gn('degree') == cgnlib(path, cache=False).detect_gn('degree', stop=FirstDrop())
+
+
+def test_never_removes_every_edge():
+    graph_data = cgnlib(os.path.join(DATASETS, 'zachary.txt'), cache=False)
+    graph_data.detect_gn('degree', stop=Never())
+    dendrogram = graph_data.dendrogram
+    assert len(dendrogram.removed_edges()) == graph_data.core.number_of_edges()
+    assert len(dendrogram.cut(len(dendrogram))) == graph_data.core.number_of_nodes()